@@ -464,6 +464,50 @@ class PinocchioAssetGenerator:
 
         return surface
 
+    def generate_all_surfaces(self) -> Dict[str, pygame.Surface]:
+        """Generate all character assets as in-memory surfaces."""
+        surfaces = {}
+
+        # Body parts (forward-facing)
+        surfaces["head"] = self.generate_head()
+        surfaces["torso"] = self.generate_torso()
+        surfaces["left_arm"] = self.generate_left_arm()
+        surfaces["right_arm"] = self.generate_right_arm()
+        surfaces["left_leg"] = self.generate_left_leg()
+        surfaces["right_leg"] = self.generate_right_leg()
+
+        # Facial features
+        surfaces["eyes_open"] = self.generate_eyes_open()
+        surfaces["eyes_closed"] = self.generate_eyes_closed()
+        surfaces["mouth_neutral"] = self.generate_mouth_neutral()
+        surfaces["mouth_open"] = self.generate_mouth_open()
+
+        # Gear
+        surfaces["hat"] = self.generate_hat()
+
+        # Directional assets
+        directions = ["left", "right", "forward", "back"]
+        for direction in directions:
+            surfaces[f"head_{direction}"] = self.generate_head_directional(direction)
+            surfaces[f"torso_{direction}"] = self.generate_torso_directional(direction)
+            for side in ("left", "right"):
+                surfaces[f"{side}_arm_{direction}"] = self.generate_arm_directional(
+                    side, direction
+                )
+                surfaces[f"{side}_leg_{direction}"] = self.generate_leg_directional(
+                    side, direction
+                )
+
+        # Walk cycle assets
+        walk_directions = ["left", "right"]
+        for direction in walk_directions:
+            for frame in range(4):  # 4 frames per walk cycle
+                surfaces[f"walk_{direction}_{frame}"] = self.generate_walk_cycle_frame(
+                    direction, frame
+                )
+
+        return surfaces
+
     def generate_all_assets(self, output_dir: Path) -> Dict[str, str]:
         """Generate all character assets and save them."""
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -488,84 +532,20 @@ class PinocchioAssetGenerator:
 
         # Generate and save assets
         asset_paths = {}
-
-        # Body parts (forward-facing)
-        asset_paths["head"] = self._save_asset(
-            self.generate_head(), body_dir / "head.png"
-        )
-        asset_paths["torso"] = self._save_asset(
-            self.generate_torso(), body_dir / "torso.png"
-        )
-        asset_paths["left_arm"] = self._save_asset(
-            self.generate_left_arm(), body_dir / "left_arm.png"
-        )
-        asset_paths["right_arm"] = self._save_asset(
-            self.generate_right_arm(), body_dir / "right_arm.png"
-        )
-        asset_paths["left_leg"] = self._save_asset(
-            self.generate_left_leg(), body_dir / "left_leg.png"
-        )
-        asset_paths["right_leg"] = self._save_asset(
-            self.generate_right_leg(), body_dir / "right_leg.png"
-        )
-
-        # Facial features
-        asset_paths["eyes_open"] = self._save_asset(
-            self.generate_eyes_open(), face_dir / "eyes_open.png"
-        )
-        asset_paths["eyes_closed"] = self._save_asset(
-            self.generate_eyes_closed(), face_dir / "eyes_closed.png"
-        )
-        asset_paths["mouth_neutral"] = self._save_asset(
-            self.generate_mouth_neutral(), mouth_dir / "mouth_neutral.png"
-        )
-        asset_paths["mouth_open"] = self._save_asset(
-            self.generate_mouth_open(), mouth_dir / "mouth_open.png"
-        )
-
-        # Gear
-        asset_paths["hat"] = self._save_asset(self.generate_hat(), gear_dir / "hat.png")
-
-        # Directional assets
-        directions = ["left", "right", "forward", "back"]
-        for direction in directions:
-            # Head directional
-            asset_paths[f"head_{direction}"] = self._save_asset(
-                self.generate_head_directional(direction),
-                directional_dir / f"head_{direction}.png",
-            )
-            # Torso directional
-            asset_paths[f"torso_{direction}"] = self._save_asset(
-                self.generate_torso_directional(direction),
-                directional_dir / f"torso_{direction}.png",
-            )
-            # Arms directional
-            asset_paths[f"left_arm_{direction}"] = self._save_asset(
-                self.generate_arm_directional("left", direction),
-                directional_dir / f"left_arm_{direction}.png",
-            )
-            asset_paths[f"right_arm_{direction}"] = self._save_asset(
-                self.generate_arm_directional("right", direction),
-                directional_dir / f"right_arm_{direction}.png",
-            )
-            # Legs directional
-            asset_paths[f"left_leg_{direction}"] = self._save_asset(
-                self.generate_leg_directional("left", direction),
-                directional_dir / f"left_leg_{direction}.png",
-            )
-            asset_paths[f"right_leg_{direction}"] = self._save_asset(
-                self.generate_leg_directional("right", direction),
-                directional_dir / f"right_leg_{direction}.png",
-            )
-
-        # Walk cycle assets
-        walk_directions = ["left", "right"]
-        for direction in walk_directions:
-            for frame in range(4):  # 4 frames per walk cycle
-                asset_paths[f"walk_{direction}_{frame}"] = self._save_asset(
-                    self.generate_walk_cycle_frame(direction, frame),
-                    walk_cycle_dir / f"walk_{direction}_{frame}.png",
-                )
+        for name, surface in self.generate_all_surfaces().items():
+            if name.startswith("eyes_"):
+                asset_dir = face_dir
+            elif name.startswith("mouth_"):
+                asset_dir = mouth_dir
+            elif name == "hat":
+                asset_dir = gear_dir
+            elif name.startswith("walk_"):
+                asset_dir = walk_cycle_dir
+            elif name.endswith(("_left", "_right", "_forward", "_back")):
+                asset_dir = directional_dir
+            else:
+                asset_dir = body_dir
+            asset_paths[name] = self._save_asset(surface, asset_dir / f"{name}.png")
 
         return asset_paths
 
@@ -605,11 +585,28 @@ def generate_character_assets(
     return asset_paths
 
 
+_character_surfaces_cache: Optional[Dict[str, pygame.Surface]] = None
+
+
+def generate_character_surfaces() -> Dict[str, pygame.Surface]:
+    """Generate all character assets in memory, without touching the disk.
+
+    The surfaces are generated once per process and shared; do not draw on them.
+    """
+    global _character_surfaces_cache
+
+    if _character_surfaces_cache is None:
+        _character_surfaces_cache = PinocchioAssetGenerator().generate_all_surfaces()
+    return _character_surfaces_cache
+
+
 def reset_character_assets_cache():
     """Reset the global character assets cache."""
     global _character_assets_cache, _character_assets_output_dir
+    global _character_surfaces_cache
     _character_assets_cache = None
     _character_assets_output_dir = None
+    _character_surfaces_cache = None
 
 
 if __name__ == "__main__":
@@ -3,7 +3,18 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
-from typing import Optional, List, Tuple, Callable, Dict
+from typing import (
+    AbstractSet,
+    Optional,
+    List,
+    Tuple,
+    Callable,
+    Dict,
+    Final,
+    Iterable,
+    Iterator,
+    Sequence,
+)
 from abc import ABC, abstractmethod
 from pathlib import Path
 
@@ -13,7 +24,10 @@ from .rendering_utils import (
     render_platform_tile,
     render_ladder_tile,
     render_hud,
+    render_hud_text,
+    present,
     render_center_mass_dot,
+    convert_for_display,
     PlayerMixin,
 )
 
@@ -72,6 +86,8 @@ class ControlledTimeProvider(TimeProvider):
 class Scene:
     def __init__(self, app: "GameApp") -> None:
         self.app = app
+        # Set whenever visible state changes; GameApp.run only redraws dirty scenes
+        self.dirty: bool = True
 
     def on_enter(self) -> None:
         pass
@@ -85,8 +101,13 @@ class Scene:
     def update(self, delta_seconds: float) -> None:
         pass
 
-    def draw(self, surface: pygame.Surface) -> None:
-        pass
+    def draw(self, surface: pygame.Surface) -> Optional[List[pygame.Rect]]:
+        """Draw the scene.
+
+        Scenes may return the screen areas that changed since the previous
+        draw; returning None means the whole surface must be presented.
+        """
+        return None
 
 
 class MenuScene(Scene):
@@ -94,11 +115,33 @@ class MenuScene(Scene):
         super().__init__(app)
         self.title_font: Optional[pygame.font.Font] = None
         self.body_font: Optional[pygame.font.Font] = None
+        # Pre-rendered (text, destination) pairs blitted every frame
+        self._rendered: List[Tuple[pygame.Surface, pygame.Rect]] = []
 
     def on_enter(self) -> None:
         self.title_font = pygame.font.Font(None, 72)
         self.body_font = pygame.font.Font(None, 36)
 
+        # The menu text and its layout never change, so prepare both once
+        center_x = self.app.width // 2
+        center_y = self.app.height // 2
+        title = convert_for_display(
+            self.title_font.render("The Dark Closet", True, (220, 220, 230))
+        )
+        subtitle = convert_for_display(
+            self.body_font.render(
+                "Press Enter to step through the portal", True, (200, 200, 210)
+            )
+        )
+        hint = convert_for_display(
+            self.body_font.render("Esc to quit", True, (160, 160, 170))
+        )
+        self._rendered = [
+            (title, title.get_rect(center=(center_x, center_y - 40))),
+            (subtitle, subtitle.get_rect(center=(center_x, center_y + 20))),
+            (hint, hint.get_rect(center=(center_x, center_y + 70))),
+        ]
+
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_RETURN:
@@ -108,49 +151,238 @@ class MenuScene(Scene):
 
     def draw(self, surface: pygame.Surface) -> None:
         surface.fill((8, 8, 12))
-        assert self.title_font is not None and self.body_font is not None
+        surface.blits(self._rendered, doreturn=False)
 
-        title = self.title_font.render("The Dark Closet", True, (220, 220, 230))
-        subtitle = self.body_font.render(
-            "Press Enter to step through the portal", True, (200, 200, 210)
-        )
-        hint = self.body_font.render("Esc to quit", True, (160, 160, 170))
 
-        surface.blit(
-            title,
-            title.get_rect(center=(self.app.width // 2, self.app.height // 2 - 40)),
-        )
-        surface.blit(
-            subtitle,
-            subtitle.get_rect(center=(self.app.width // 2, self.app.height // 2 + 20)),
-        )
-        surface.blit(
-            hint, hint.get_rect(center=(self.app.width // 2, self.app.height // 2 + 70))
-        )
+TILE_SIZE: Final = 128  # 4x 32 for higher resolution
+TILE_EMPTY: Final = " "
+TILE_METAL: Final = "#"
+TILE_BRICK: Final = "B"
+TILE_PLATFORM: Final = "-"  # one-way (from above only)
+TILE_LADDER: Final = "H"
+TILE_BOUNDARY: Final = "X"  # impassable, unbreakable level boundary
+
+# The world grid stores each tile as the byte code of its map character
+TILE_EMPTY_BYTE: Final = ord(TILE_EMPTY)
+TILE_METAL_BYTE: Final = ord(TILE_METAL)
+TILE_BRICK_BYTE: Final = ord(TILE_BRICK)
+TILE_PLATFORM_BYTE: Final = ord(TILE_PLATFORM)
+TILE_LADDER_BYTE: Final = ord(TILE_LADDER)
+TILE_BOUNDARY_BYTE: Final = ord(TILE_BOUNDARY)
+
 
+def _tile_lookup(*codes: int) -> bytes:
+    """Build a 256-entry table that is 1 at the given tile byte codes."""
+    table = bytearray(256)
+    for code in codes:
+        table[code] = 1
+    return bytes(table)
+
+
+# Tile classification tables indexed directly by tile byte code
+SOLID_TILES: Final = _tile_lookup(TILE_METAL_BYTE, TILE_BRICK_BYTE, TILE_BOUNDARY_BYTE)
+ONE_WAY_TILES: Final = _tile_lookup(TILE_PLATFORM_BYTE)
+LADDER_TILES: Final = _tile_lookup(TILE_LADDER_BYTE)
+COLLIDABLE_TILES: Final = bytes(a | b for a, b in zip(SOLID_TILES, ONE_WAY_TILES))
+
+# Procedural body parts overhang player_rect by up to 35 px on each side
+_PLAYER_SPRITE_MARGIN = 48
+
+# The world is pre-rendered lazily in square pages of this many tiles per side
+TILE_PAGE_TILES: Final = 8
+TILE_PAGE_SIZE: Final = TILE_PAGE_TILES * TILE_SIZE
+# Pixels of this color are transparent in pre-rendered pages and strips
+_TILE_PAGE_COLORKEY = (255, 0, 254)
+# Tile artwork may spill this many pixels past the right and bottom edges
+_TILE_SPRITE_OVERHANG = 16
+
+
+@dataclass(frozen=True)
+class _SceneryLayer:
+    """A band of evenly spaced blocks scrolling at a fraction of the camera.
+
+    A layer with a ``backdrop`` color is opaque and spans the full view
+    height, so it also paints the sky behind its blocks.
+    """
+
+    factor: float
+    period: int
+    block_width: int
+    block_height: int
+    color: Tuple[int, int, int]
+    backdrop: Optional[Tuple[int, int, int]] = None
+
+
+_SKY_COLOR = (18, 22, 30)
+_SCENERY_FAR = _SceneryLayer(
+    0.3, 4 * TILE_SIZE, 3 * TILE_SIZE, 8 * TILE_SIZE, (30, 34, 46), _SKY_COLOR
+)
+_SCENERY_NEAR = _SceneryLayer(
+    0.6, 3 * TILE_SIZE, 2 * TILE_SIZE, 5 * TILE_SIZE, (40, 46, 60)
+)
+_SCENERY_FORE = _SceneryLayer(
+    1.2, 5 * TILE_SIZE, TILE_SIZE, 2 * TILE_SIZE, (12, 14, 18)
+)
+
+
+# Key codes read by read_input_mask every frame
+_K_LEFT = pygame.K_LEFT
+_K_RIGHT = pygame.K_RIGHT
+_K_UP = pygame.K_UP
+_K_DOWN = pygame.K_DOWN
+_K_a = pygame.K_a
+_K_d = pygame.K_d
+_K_w = pygame.K_w
+_K_s = pygame.K_s
+_K_SPACE = pygame.K_SPACE
+
+# Bits of the per-frame input mask built by read_input_mask
+INPUT_LEFT: Final = 1
+INPUT_RIGHT: Final = 2
+INPUT_UP: Final = 4
+INPUT_DOWN: Final = 8
+INPUT_JUMP: Final = 16
+
+
+def read_input_mask(keys: Sequence[bool]) -> int:
+    """Fold the pressed movement keys into a single INPUT_* bitmask."""
+    mask = 0
+    if keys[_K_LEFT] or keys[_K_a]:
+        mask |= INPUT_LEFT
+    if keys[_K_RIGHT] or keys[_K_d]:
+        mask |= INPUT_RIGHT
+    if keys[_K_UP] or keys[_K_w]:
+        mask |= INPUT_UP
+    if keys[_K_DOWN] or keys[_K_s]:
+        mask |= INPUT_DOWN
+    if keys[_K_SPACE]:
+        mask |= INPUT_JUMP
+    return mask
+
+
+# Size in tiles of the handcrafted default world
+_DEFAULT_WORLD_COLS: Final = 120
+_DEFAULT_WORLD_ROWS: Final = 30
+
+
+def _build_default_world() -> bytearray:
+    """Build the handcrafted default world as a flat row-major tile buffer."""
+    # Simple handcrafted map: top sky, platforms, bricks, metals ground
+    width = _DEFAULT_WORLD_COLS
+    height = _DEFAULT_WORLD_ROWS
+    buf = bytearray([TILE_EMPTY_BYTE]) * (width * height)
+
+    def fill(row: int, cols: slice, code: int) -> None:
+        # Single slice assignment instead of a per-cell Python loop
+        start, stop, step = cols.indices(width)
+        base = row * width
+        buf[base + start : base + stop : step] = bytes([code]) * len(
+            range(start, stop, step)
+        )
 
-TILE_SIZE: int = 128  # 4x 32 for higher resolution
-TILE_EMPTY = " "
-TILE_METAL = "#"
-TILE_BRICK = "B"
-TILE_PLATFORM = "-"  # one-way (from above only)
-TILE_LADDER = "H"
-TILE_BOUNDARY = "X"  # impassable, unbreakable level boundary
+    # Sky
+    r = 12
+    # Floating structures
+    fill(r, slice(10, 25), TILE_PLATFORM_BYTE)
+    fill(r, slice(40, 48), TILE_PLATFORM_BYTE)
+    fill(r, slice(72, 90, 4), TILE_LADDER_BYTE)
+    r += 1
+
+    fill(r, slice(15, 17), TILE_BRICK_BYTE)
+    fill(r, slice(30, 36), TILE_BRICK_BYTE)
+    fill(r, slice(60, 62), TILE_BRICK_BYTE)
+    r += 1
+
+    # Mid-level platforms and ladders
+    r += 4
+
+    # Three-wide platforms on columns 0-2 (mod 6) between 20 and 50
+    for phase in range(3):
+        fill(r, slice(20 + (phase - 20) % 6, 50, 6), TILE_PLATFORM_BYTE)
+    fill(r, slice(80, 90), TILE_PLATFORM_BYTE)
+    r += 1
+
+    # More sky
+    r += 8
+
+    # Ground top bricks/metal mix
+    fill(r, slice(0, width, 13), TILE_BRICK_BYTE)
+    r += 1
+
+    # Solid metal ground (2 layers)
+    fill(r, slice(0, width), TILE_METAL_BYTE)
+    fill(r + 1, slice(0, width), TILE_METAL_BYTE)
+
+    # Stamp a couple of vertical ladders connecting layers
+    def put_ladder(col: int, start_row: int, end_row: int) -> None:
+        lo = max(0, min(start_row, end_row))
+        hi = min(height - 1, max(start_row, end_row))
+        if 0 <= col < width:
+            # Every width-th byte from (lo, col) walks down the column
+            column = slice(lo * width + col, (hi + 1) * width, width)
+            buf[column] = bytes([TILE_LADDER_BYTE]) * (hi - lo + 1)
+
+    # Example ladders
+    put_ladder(22, 6, height - 4)
+    put_ladder(84, 8, height - 6)
+
+    return buf
+
+
+# The default world is deterministic, so build it once and copy it per scene
+_DEFAULT_WORLD: Final = bytes(_build_default_world())
+
+# Character art converted for the display, shared by every scene. Keyed by
+# file, modification time and display pixel format, so regenerated files and
+# new display modes are loaded again.
+_converted_images: Dict[Tuple[str, int, object], pygame.Surface] = {}
+
+
+def _load_converted_image(path: Path) -> pygame.Surface:
+    """Load an image with per-pixel alpha in the display format, once."""
+    screen = pygame.display.get_surface()
+    display_format = (
+        (screen.get_bitsize(), screen.get_masks()) if screen is not None else None
+    )
+    key = (str(path.resolve()), path.stat().st_mtime_ns, display_format)
+    image = _converted_images.get(key)
+    if image is None:
+        image = pygame.image.load(str(path)).convert_alpha()
+        _converted_images[key] = image
+    return image
 
 
 class SideScrollerScene(Scene, PlayerMixin):
     def __init__(
         self,
         app: "GameApp",
-        world_tiles: Optional[List[str]] = None,
+        world_tiles: Optional[Sequence[str]] = None,
         player_spawn_px: Optional[Tuple[int, int]] = None,
     ) -> None:
         super().__init__(app)
-        self.world_tiles: List[str] = (
-            world_tiles if world_tiles is not None else self._build_world()
-        )
-        self.world_cols = max(len(row) for row in self.world_tiles)
-        self.world_rows = len(self.world_tiles)
+        # One contiguous row-major buffer of tile byte codes
+        if world_tiles is None:
+            self.world_cols = _DEFAULT_WORLD_COLS
+            self.world_rows = _DEFAULT_WORLD_ROWS
+            self._tiles = bytearray(_DEFAULT_WORLD)
+        else:
+            rows = [bytearray("".join(row), "ascii") for row in world_tiles]
+            self.world_cols = max(len(row) for row in rows)
+            self.world_rows = len(rows)
+            # Short rows are padded with empty tiles
+            self._tiles = bytearray([TILE_EMPTY_BYTE]) * (
+                self.world_rows * self.world_cols
+            )
+            for r, row in enumerate(rows):
+                start = r * self.world_cols
+                self._tiles[start : start + len(row)] = row
+        view = memoryview(self._tiles)
+        self.world_tiles: List[memoryview] = [
+            view[r * self.world_cols : (r + 1) * self.world_cols]
+            for r in range(self.world_rows)
+        ]
+        # 1 for rows holding at least one non-empty tile, kept in sync by _set_tile
+        self._row_filled = self._scan_row_filled()
         self.world_width_px = self.world_cols * TILE_SIZE
         self.world_height_px = self.world_rows * TILE_SIZE
 
@@ -161,119 +393,162 @@ class SideScrollerScene(Scene, PlayerMixin):
         else:
             spawn_x, spawn_y = player_spawn_px
 
-        # Character assets (lazy loaded)
+        # Character assets (lazy loaded) and their copies scaled to the player
         self._character_assets: Optional[Dict[str, pygame.Surface]] = None
+        self._scaled_assets: Dict[Tuple[str, Tuple[int, int]], pygame.Surface] = {}
 
         # Initialize player state using shared configuration
         self._init_player_state(spawn_x, spawn_y)
 
+        # Pre-rendered HUD text, created once the font exists
+        self._hud_text: Optional[pygame.Surface] = None
+
+        # Pre-rendered world pages keyed by (page_col, page_row)
+        self._tile_pages: Dict[Tuple[int, int], pygame.Surface] = {}
+        self._tile_sprite_cache: Optional[Dict[int, pygame.Surface]] = None
+        # Pre-rendered scenery strips keyed by (layer, view size)
+        self._scenery_strips: Dict[
+            Tuple[_SceneryLayer, Tuple[int, int]], pygame.Surface
+        ] = {}
+
+        # What the previous draw put on screen, used to report dirty rects
+        self._drawn_camera: Optional[Tuple[int, int]] = None
+        self._drawn_sprite_area: Optional[pygame.Rect] = None
+        # World-space areas of tile edits not yet reported as dirty
+        self._changed_areas: List[pygame.Rect] = []
+
     def on_enter(self) -> None:
         self.hud_font = pygame.font.Font(None, 96)  # 4x 24 for higher resolution
+        self._hud_text = render_hud_text(self.hud_font)
 
     # --- World helpers ---
-    def _build_world(self) -> List[str]:
-        # Simple handcrafted map: top sky, platforms, bricks, metals ground
-        rows: List[str] = []
-        empty = TILE_EMPTY
-        width = 120
-        # Sky
-        for _ in range(12):
-            rows.append(empty * width)
-        # Floating structures
-        row = list(empty * width)
-        for i in range(10, 25):
-            row[i] = TILE_PLATFORM
-        for i in range(40, 48):
-            row[i] = TILE_PLATFORM
-        for i in range(70, 90, 2):
-            row[i] = TILE_LADDER if i % 4 == 0 else empty
-        rows.append("".join(row))
-
-        row = list(empty * width)
-        for i in range(15, 17):
-            row[i] = TILE_BRICK
-        for i in range(30, 36):
-            row[i] = TILE_BRICK
-        for i in range(60, 62):
-            row[i] = TILE_BRICK
-        rows.append("".join(row))
-
-        # Mid-level platforms and ladders
-        for _ in range(4):
-            rows.append(empty * width)
-
-        row = list(empty * width)
-        for i in range(20, 50):
-            if i % 6 in (0, 1, 2):
-                row[i] = TILE_PLATFORM
-        for i in range(80, 90):
-            row[i] = TILE_PLATFORM
-        rows.append("".join(row))
-
-        # More sky
-        for _ in range(8):
-            rows.append(empty * width)
-
-        # Ground top bricks/metal mix
-        ground_row_top = list(empty * width)
-        for i in range(width):
-            if i % 13 == 0:
-                ground_row_top[i] = TILE_BRICK
-        rows.append("".join(ground_row_top))
-
-        # Solid metal ground (2 layers)
-        metal_row = TILE_METAL * width
-        rows.append(metal_row)
-        rows.append(metal_row)
-
-        # Stamp a couple of vertical ladders connecting layers
-        def put_ladder(col: int, start_row: int, end_row: int) -> None:
-            lo = max(0, min(start_row, end_row))
-            hi = min(len(rows) - 1, max(start_row, end_row))
-            for r in range(lo, hi + 1):
-                line = list(rows[r])
-                if 0 <= col < len(line):
-                    line[col] = TILE_LADDER
-                    rows[r] = "".join(line)
-
-        # Example ladders
-        put_ladder(22, 6, len(rows) - 4)
-        put_ladder(84, 8, len(rows) - 6)
-
-        return rows
-
-    def _tile_at(self, col: int, row: int) -> str:
-        if row < 0 or row >= self.world_rows:
-            return TILE_METAL  # outside treated as solid
-        line = self.world_tiles[row]
-        if col < 0 or col >= len(line):
-            return TILE_METAL  # outside treated as solid
-        return line[col]
-
-    def _set_tile(self, col: int, row: int, value: str) -> None:
-        if 0 <= row < self.world_rows:
-            line = list(self.world_tiles[row])
-            if 0 <= col < len(line):
-                line[col] = value
-                self.world_tiles[row] = "".join(line)
+    def _scan_row_filled(self) -> bytearray:
+        cols = self.world_cols
+        return bytearray(
+            self._tiles.count(TILE_EMPTY_BYTE, start, start + cols) != cols
+            for start in range(0, self.world_rows * cols, cols)
+        )
+
+    def snapshot(self) -> bytes:
+        """Return a copy of the tile grid that ``restore`` can roll back to."""
+        return bytes(self._tiles)
+
+    def restore(self, snap: bytes) -> None:
+        """Put back the tile grid saved by ``snapshot``; the player is untouched."""
+        if len(snap) != len(self._tiles):
+            raise ValueError(
+                f"snapshot holds {len(snap)} tiles, world has {len(self._tiles)}"
+            )
+        self._tiles[:] = snap
+        self._row_filled[:] = self._scan_row_filled()
+        # Pages are repainted lazily and the next frame is drawn in full
+        self._tile_pages.clear()
+        self._changed_areas.clear()
+        self._drawn_camera = None
+        self.dirty = True
+
+    def _tile_at(self, col: int, row: int) -> int:
+        if 0 <= col < self.world_cols and 0 <= row < self.world_rows:
+            return self._tiles[row * self.world_cols + col]
+        return TILE_METAL_BYTE  # outside treated as solid
+
+    def _set_tile(self, col: int, row: int, value: int) -> None:
+        if 0 <= col < self.world_cols and 0 <= row < self.world_rows:
+            cols = self.world_cols
+            start = row * cols
+            self._tiles[start + col] = value
+            if value != TILE_EMPTY_BYTE:
+                self._row_filled[row] = 1
+            elif self._row_filled[row]:
+                # Only clearing a tile can empty its row
+                self._row_filled[row] = (
+                    self._tiles.count(TILE_EMPTY_BYTE, start, start + cols) != cols
+                )
+            # Tiles can spill into their right and lower neighbours
+            self._repaint_tiles(col, row, col + 1, row + 1)
+            self._changed_areas.append(
+                pygame.Rect(
+                    col * TILE_SIZE, row * TILE_SIZE, 2 * TILE_SIZE, 2 * TILE_SIZE
+                )
+            )
+            self.dirty = True
 
     def _tiles_overlapping_rect(
         self, rect: pygame.Rect
-    ) -> List[Tuple[int, int, str, pygame.Rect]]:
-        tiles: List[Tuple[int, int, str, pygame.Rect]] = []
+    ) -> Iterator[Tuple[int, int, int]]:
+        """Yield ``(col, row, tile)`` for each non-empty tile under ``rect``."""
         left = rect.left // TILE_SIZE
         right = (rect.right - 1) // TILE_SIZE
         top = rect.top // TILE_SIZE
         bottom = (rect.bottom - 1) // TILE_SIZE
+        cols = self.world_cols
+        if left < 0 or top < 0 or right >= cols or bottom >= self.world_rows:
+            # Straddling the world edge: outside cells must read as solid
+            tile_at = self._tile_at
+            for ty in range(top, bottom + 1):
+                for tx in range(left, right + 1):
+                    t = tile_at(tx, ty)
+                    if t != TILE_EMPTY_BYTE:
+                        yield tx, ty, t
+            return
+
+        # Fully inside: slice each row once and skip all-empty spans
+        tiles = self._tiles
+        row_filled = self._row_filled
+        width = right - left + 1
         for ty in range(top, bottom + 1):
-            for tx in range(left, right + 1):
-                t = self._tile_at(tx, ty)
-                if t != TILE_EMPTY:
-                    tile_rect = pygame.Rect(
-                        tx * TILE_SIZE, ty * TILE_SIZE, TILE_SIZE, TILE_SIZE
-                    )
-                    tiles.append((tx, ty, t, tile_rect))
-        return tiles
+            if not row_filled[ty]:
+                continue
+            start = ty * cols + left
+            span = tiles[start : start + width]
+            if span.count(TILE_EMPTY_BYTE) == width:
+                continue
+            for tx, t in enumerate(span, left):
+                if t != TILE_EMPTY_BYTE:
+                    yield tx, ty, t
+
+    def _solid_col_span(self, rect: pygame.Rect) -> Optional[Tuple[int, int]]:
+        """Return the first and last solid tile columns under ``rect``, if any."""
+        left = rect.left // TILE_SIZE
+        right = (rect.right - 1) // TILE_SIZE
+        top = rect.top // TILE_SIZE
+        bottom = (rect.bottom - 1) // TILE_SIZE
+        cols = self.world_cols
+        if top < 0 or bottom >= self.world_rows:
+            return left, right  # a whole row outside the world is solid
+
+        # Columns outside the world are solid
+        first: Optional[int] = None
+        last: Optional[int] = None
+        if left < 0:
+            first, last = left, min(right, -1)
+        if right >= cols:
+            last = right
+            if first is None:
+                first = max(left, cols)
+        lo = max(left, 0)
+        hi = min(right, cols - 1) + 1
+        tiles = self._tiles
+        row_filled = self._row_filled
+        # Skip the scan when the rect lies entirely beside the world
+        for ty in range(top, bottom + 1) if lo < hi else ():
+            if not row_filled[ty]:
+                continue
+            start = ty * cols
+            # Map the row span to 0/1 solidity in C, then search it
+            solid = tiles[start + lo : start + hi].translate(SOLID_TILES)
+            i = solid.find(1)
+            if i < 0:
+                continue
+            if first is None or lo + i < first:
+                first = lo + i
+            j = lo + solid.rfind(1)
+            if last is None or j > last:
+                last = j
+
+        if first is None or last is None:
+            return None
+        return first, last
 
     # --- Input & Update ---
     def handle_event(self, event: pygame.event.Event) -> None:
@@ -281,34 +556,43 @@ class SideScrollerScene(Scene, PlayerMixin):
             self.app.request_quit()
 
     def update(self, delta_seconds: float) -> None:
-        keys = pygame.key.get_pressed()
+        # Read the keyboard once per frame; up doubles as jump
+        held = read_input_mask(pygame.key.get_pressed())
+        want_down = held & INPUT_DOWN
+        want_jump = held & (INPUT_JUMP | INPUT_UP)
+
+        # Bind hot attributes to locals for the rest of the frame
+        player_rect = self.player_rect
+        tiles_overlapping_rect = self._tiles_overlapping_rect
+        prev_x = player_rect.x
+        prev_y = player_rect.y
+        prev_camera_x = self.camera_x
 
         # Horizontal input
-        move_left = keys[pygame.K_LEFT] or keys[pygame.K_a]
-        move_right = keys[pygame.K_RIGHT] or keys[pygame.K_d]
         self.player_velocity_x = 0.0
-        if move_left:
+        if held & INPUT_LEFT:
             self.player_velocity_x -= self.player_speed_px_per_sec
-        if move_right:
+        if held & INPUT_RIGHT:
             self.player_velocity_x += self.player_speed_px_per_sec
 
-        # Ladder check: inside any ladder tile at player center
-        player_center_col = (self.player_rect.centerx) // TILE_SIZE
-        player_center_row = (self.player_rect.centery) // TILE_SIZE
+        # Ladder check: inside any ladder tile at player center. Inlined
+        # _tile_at; cells outside the world are never ladders
+        cols = self.world_cols
+        center_col = player_rect.centerx // TILE_SIZE
+        center_row = player_rect.centery // TILE_SIZE
         inside_ladder = (
-            self._tile_at(player_center_col, player_center_row) == TILE_LADDER
+            0 <= center_col < cols
+            and 0 <= center_row < self.world_rows
+            and bool(LADDER_TILES[self._tiles[center_row * cols + center_col]])
         )
 
         # Jump / climb
-        want_jump = keys[pygame.K_SPACE] or keys[pygame.K_w] or keys[pygame.K_UP]
-        want_down = keys[pygame.K_s] or keys[pygame.K_DOWN]
-
-        self.on_ladder = inside_ladder and (want_jump or want_down or keys[pygame.K_UP])
+        self.on_ladder = inside_ladder and bool(want_jump or want_down)
         if self.on_ladder:
             # Climb: cancel gravity, allow up/down movement
             climb_speed = self.player_speed_px_per_sec * 0.8
             self.player_velocity_y = 0.0
-            if keys[pygame.K_UP] or keys[pygame.K_w]:
+            if held & INPUT_UP:
                 self.player_velocity_y = -climb_speed
             elif want_down:
                 self.player_velocity_y = climb_speed
@@ -321,150 +605,293 @@ class SideScrollerScene(Scene, PlayerMixin):
 
         # Removed unused prev_rect to satisfy linter
 
-        # Horizontal movement and collisions (solid tiles only)
-        self.player_rect.x += int(self.player_velocity_x * delta_seconds)
-        for tx, ty, t, tile_rect in self._tiles_overlapping_rect(self.player_rect):
-            if t in (TILE_METAL, TILE_BRICK, TILE_BOUNDARY):
-                if (
-                    self.player_velocity_x > 0
-                    and self.player_rect.right > tile_rect.left
-                ):
-                    self.player_rect.right = tile_rect.left
-                elif (
-                    self.player_velocity_x < 0
-                    and self.player_rect.left < tile_rect.right
-                ):
-                    self.player_rect.left = tile_rect.right
+        # Horizontal movement and collisions (solid tiles only): moving right
+        # stops at the leftmost overlapped solid column, moving left at the
+        # rightmost one
+        player_rect.x += int(self.player_velocity_x * delta_seconds)
+        if self.player_velocity_x:
+            solid_cols = self._solid_col_span(player_rect)
+            if solid_cols is not None:
+                if self.player_velocity_x > 0:
+                    player_rect.right = solid_cols[0] * TILE_SIZE
+                else:
+                    player_rect.left = (solid_cols[1] + 1) * TILE_SIZE
 
         # Vertical movement and collisions
-        prev_bottom = self.player_rect.bottom
-        prev_top = self.player_rect.top
-        self.player_rect.y += int(self.player_velocity_y * delta_seconds)
+        prev_bottom = player_rect.bottom
+        prev_top = player_rect.top
+        player_rect.y += int(self.player_velocity_y * delta_seconds)
         self.on_ground = False
 
-        collisions = self._tiles_overlapping_rect(self.player_rect)
-        for tx, ty, t, tile_rect in collisions:
-            if t == TILE_BRICK and self.player_velocity_y < 0:
+        for tx, ty, t in tiles_overlapping_rect(player_rect):
+            if not COLLIDABLE_TILES[t]:
+                continue  # ladders and decoration never block
+            # Tile edges as plain ints; no Rect is needed to resolve them
+            tile_top = ty * TILE_SIZE
+            tile_bottom = tile_top + TILE_SIZE
+            if t == TILE_BRICK_BYTE and self.player_velocity_y < 0:
                 # Break brick when hitting from below: previously below its bottom, now intersecting upward
-                if (
-                    prev_top >= tile_rect.bottom
-                    and self.player_rect.top <= tile_rect.bottom
-                ):
-                    self._set_tile(tx, ty, TILE_EMPTY)
+                if prev_top >= tile_bottom and player_rect.top <= tile_bottom:
+                    self._set_tile(tx, ty, TILE_EMPTY_BYTE)
                     continue
 
-            if t in (TILE_METAL, TILE_BRICK, TILE_BOUNDARY):
-                if (
-                    self.player_velocity_y > 0
-                    and self.player_rect.bottom > tile_rect.top
-                ):
-                    self.player_rect.bottom = tile_rect.top
+            if SOLID_TILES[t]:
+                if self.player_velocity_y > 0 and player_rect.bottom > tile_top:
+                    player_rect.bottom = tile_top
                     self.player_velocity_y = 0
                     self.on_ground = True
-                elif (
-                    self.player_velocity_y < 0
-                    and self.player_rect.top < tile_rect.bottom
-                ):
-                    self.player_rect.top = tile_rect.bottom
+                elif self.player_velocity_y < 0 and player_rect.top < tile_bottom:
+                    player_rect.top = tile_bottom
                     self.player_velocity_y = 0
 
-            elif t == TILE_PLATFORM:
+            elif ONE_WAY_TILES[t]:
                 # One-way: only collide if falling and was above the platform
                 if (
                     self.player_velocity_y > 0
-                    and prev_bottom <= tile_rect.top
-                    and self.player_rect.bottom >= tile_rect.top
+                    and prev_bottom <= tile_top
+                    and player_rect.bottom >= tile_top
                 ):
                     # Optional: drop-through by holding down
                     if not want_down:
-                        self.player_rect.bottom = tile_rect.top
+                        player_rect.bottom = tile_top
                         self.player_velocity_y = 0
                         self.on_ground = True
 
-        # Constrain to world bounds
-        self.player_rect.clamp_ip(
-            pygame.Rect(0, 0, self.world_width_px, self.world_height_px)
-        )
-
-        # Camera follow
-        target_camera_x = self.player_rect.centerx - self.app.width // 2
-        self.camera_x = max(
-            0, min(self.world_width_px - self.app.width, target_camera_x)
-        )
+        # Constrain to world bounds (the world is never smaller than the player)
+        if player_rect.left < 0:
+            player_rect.left = 0
+        elif player_rect.right > self.world_width_px:
+            player_rect.right = self.world_width_px
+        if player_rect.top < 0:
+            player_rect.top = 0
+        elif player_rect.bottom > self.world_height_px:
+            player_rect.bottom = self.world_height_px
+
+        # Camera follow, pinned to the left edge when the world is narrower
+        # than the view
+        camera_x = player_rect.centerx - self.app.width // 2
+        max_camera_x = self.world_width_px - self.app.width
+        if camera_x > max_camera_x:
+            camera_x = max_camera_x
+        if camera_x < 0:
+            camera_x = 0
+        self.camera_x = camera_x
         self.camera_y = 0
 
+        if (
+            player_rect.x != prev_x
+            or player_rect.y != prev_y
+            or self.camera_x != prev_camera_x
+        ):
+            self.dirty = True
+
     # --- Rendering ---
-    def draw(self, surface: pygame.Surface) -> None:
-        # Sky
-        surface.fill((18, 22, 30))
+    def draw(self, surface: pygame.Surface) -> Optional[List[pygame.Rect]]:
+        # Integer camera offsets shared by every draw pass this frame
+        cam_x = int(self.camera_x)
+        cam_y = int(self.camera_y)
 
-        # Parallax backgrounds
-        self._draw_parallax(surface)
+        # Sky and parallax backgrounds; the opaque far layer covers the sky
+        self._draw_parallax(surface, cam_x)
 
         # World tiles in view
-        self._draw_tiles(surface)
+        self._draw_tiles(surface, cam_x, cam_y)
 
         # Player (drawn after tiles but before foreground)
-        pr = self.player_rect.move(-int(self.camera_x), -int(self.camera_y))
+        pr = self.player_rect.move(-cam_x, -cam_y)
         self._draw_procedural_player(surface, pr)
 
         # Foreground accents (drawn after player for proper depth)
-        self._draw_foreground(surface)
+        self._draw_foreground(surface, cam_x)
 
         # HUD
-        render_hud(surface, self.hud_font)
+        render_hud(surface, self.hud_font, self._hud_text)
 
         # Draw center mass dot after all other rendering (so it's not overwritten)
         render_center_mass_dot(surface, self.player_rect, self.camera_x, self.camera_y)
 
-    def _draw_parallax(self, surface: pygame.Surface) -> None:
-        width = surface.get_width()
-        height = surface.get_height()
-
-        # Far background (mountain silhouettes)
-        factor_far = 0.3
-        offset_far = -int(self.camera_x * factor_far) % (4 * TILE_SIZE)
-        for x in range(-offset_far, width + 4 * TILE_SIZE, 4 * TILE_SIZE):
-            rect = pygame.Rect(x, height - 8 * TILE_SIZE, 3 * TILE_SIZE, 8 * TILE_SIZE)
-            pygame.draw.rect(surface, (30, 34, 46), rect)
-
-        # Near background (hills)
-        factor_near = 0.6
-        offset_near = -int(self.camera_x * factor_near) % (3 * TILE_SIZE)
-        for x in range(-offset_near, width + 3 * TILE_SIZE, 3 * TILE_SIZE):
-            rect = pygame.Rect(x, height - 5 * TILE_SIZE, 2 * TILE_SIZE, 5 * TILE_SIZE)
-            pygame.draw.rect(surface, (40, 46, 60), rect)
-
-    def _draw_tiles(self, surface: pygame.Surface) -> None:
-        view_left_col = max(0, int(self.camera_x) // TILE_SIZE)
-        view_right_col = min(
-            self.world_cols - 1, (int(self.camera_x) + self.app.width) // TILE_SIZE + 1
+        # With a still camera only the player's old and new areas and any
+        # edited tiles changed
+        sprite_area = pr.inflate(2 * _PLAYER_SPRITE_MARGIN, 2 * _PLAYER_SPRITE_MARGIN)
+        dirty_rects: Optional[List[pygame.Rect]] = None
+        if (cam_x, cam_y) == self._drawn_camera and self._drawn_sprite_area:
+            dirty_rects = [self._drawn_sprite_area, sprite_area]
+            dirty_rects.extend(
+                area.move(-cam_x, -cam_y) for area in self._changed_areas
+            )
+        self._changed_areas.clear()
+        self._drawn_camera = (cam_x, cam_y)
+        self._drawn_sprite_area = sprite_area
+        return dirty_rects
+
+    def _draw_parallax(self, surface: pygame.Surface, cam_x: int) -> None:
+        # Far background (sky and mountain silhouettes), then near background (hills)
+        self._draw_scenery(surface, cam_x, _SCENERY_FAR)
+        self._draw_scenery(surface, cam_x, _SCENERY_NEAR)
+
+    def _draw_scenery(
+        self, surface: pygame.Surface, cam_x: int, layer: _SceneryLayer
+    ) -> None:
+        """Blit a repeating scenery layer scrolled by its parallax factor."""
+        view_size = surface.get_size()
+        strip = self._scenery_strips.get((layer, view_size))
+        if strip is None:
+            strip = self._render_scenery_strip(layer, view_size)
+        offset = -int(cam_x * layer.factor) % layer.period
+        surface.blit(strip, (-offset, view_size[1] - strip.get_height()))
+
+    def _render_scenery_strip(
+        self, layer: _SceneryLayer, view_size: Tuple[int, int]
+    ) -> pygame.Surface:
+        """Render enough repeats of a layer to cover the view at any offset."""
+        view_width, view_height = view_size
+        period = layer.period
+        height = view_height if layer.backdrop is not None else layer.block_height
+        strip = convert_for_display(
+            pygame.Surface((period * (view_width // period + 2), height)), alpha=False
+        )
+        if layer.backdrop is not None:
+            strip.fill(layer.backdrop)
+        else:
+            strip.fill(_TILE_PAGE_COLORKEY)
+            strip.set_colorkey(_TILE_PAGE_COLORKEY)
+        top = height - layer.block_height
+        for x in range(0, strip.get_width(), period):
+            strip.fill(layer.color, (x, top, layer.block_width, layer.block_height))
+        self._scenery_strips[(layer, view_size)] = strip
+        return strip
+
+    def _draw_tiles(self, surface: pygame.Surface, cam_x: int, cam_y: int) -> None:
+        # Pages reach one tile past the world so edge tiles can overhang it
+        last_page_col = self.world_cols // TILE_PAGE_TILES
+        last_page_row = self.world_rows // TILE_PAGE_TILES
+        first_col = max(0, cam_x // TILE_PAGE_SIZE)
+        last_col = min(last_page_col, (cam_x + self.app.width - 1) // TILE_PAGE_SIZE)
+        first_row = max(0, cam_y // TILE_PAGE_SIZE)
+        last_row = min(last_page_row, (cam_y + self.app.height - 1) // TILE_PAGE_SIZE)
+
+        blit = surface.blit
+        tile_page = self._tile_page
+        row_filled = self._row_filled
+        for page_row in range(first_row, last_row + 1):
+            # Skip bands of empty rows, including the row that can overhang them
+            top = page_row * TILE_PAGE_TILES
+            if 1 not in row_filled[max(0, top - 1) : top + TILE_PAGE_TILES]:
+                continue
+            y = page_row * TILE_PAGE_SIZE - cam_y
+            for page_col in range(first_col, last_col + 1):
+                blit(
+                    tile_page(page_col, page_row),
+                    (page_col * TILE_PAGE_SIZE - cam_x, y),
+                )
+
+    def _tile_page(self, page_col: int, page_row: int) -> pygame.Surface:
+        """Return the pre-rendered page of tiles, rendering it on first use."""
+        page = self._tile_pages.get((page_col, page_row))
+        if page is None:
+            page = convert_for_display(
+                pygame.Surface((TILE_PAGE_SIZE, TILE_PAGE_SIZE)), alpha=False
+            )
+            page.set_colorkey(_TILE_PAGE_COLORKEY)
+            left = page_col * TILE_PAGE_TILES
+            top = page_row * TILE_PAGE_TILES
+            self._paint_page(
+                page,
+                page_col,
+                page_row,
+                (left, top, left + TILE_PAGE_TILES - 1, top + TILE_PAGE_TILES - 1),
+            )
+            self._tile_pages[(page_col, page_row)] = page
+        return page
+
+    def _paint_page(
+        self,
+        page: pygame.Surface,
+        page_col: int,
+        page_row: int,
+        tile_range: Tuple[int, int, int, int],
+    ) -> None:
+        """Repaint the ``(left, top, right, bottom)`` tile range of a page."""
+        left, top, right, bottom = tile_range
+        origin_x = page_col * TILE_PAGE_SIZE
+        origin_y = page_row * TILE_PAGE_SIZE
+        clip = pygame.Rect(
+            left * TILE_SIZE - origin_x,
+            top * TILE_SIZE - origin_y,
+            (right - left + 1) * TILE_SIZE,
+            (bottom - top + 1) * TILE_SIZE,
         )
-        view_top_row = 0
-        view_bottom_row = self.world_rows - 1
-
-        for ty in range(view_top_row, view_bottom_row + 1):
-            line = self.world_tiles[ty]
-            for tx in range(view_left_col, view_right_col + 1):
-                t = line[tx] if tx < len(line) else TILE_EMPTY
-                if t == TILE_EMPTY:
+        page.set_clip(clip)
+        page.fill(_TILE_PAGE_COLORKEY)
+
+        # Start one tile up and left so overhanging neighbours are drawn too,
+        # in the same row-major order as drawing straight to the screen
+        sprites = self._tile_sprites()
+        tiles = self._tiles
+        cols = self.world_cols
+        row_filled = self._row_filled
+        pairs = []
+        append = pairs.append
+        for ty in range(max(0, top - 1), min(self.world_rows - 1, bottom) + 1):
+            if not row_filled[ty]:
+                continue
+            base = ty * cols
+            y = ty * TILE_SIZE - origin_y
+            for tx in range(max(0, left - 1), min(cols - 1, right) + 1):
+                sprite = sprites.get(tiles[base + tx])
+                if sprite is not None:
+                    append((sprite, (tx * TILE_SIZE - origin_x, y)))
+        page.blits(pairs, doreturn=False)
+
+        page.set_clip(None)
+
+    def _tile_sprites(self) -> Dict[int, pygame.Surface]:
+        """Return one pre-rendered sprite per drawable tile type."""
+        if self._tile_sprite_cache is None:
+            size = TILE_SIZE + _TILE_SPRITE_OVERHANG
+            sprites = {}
+            for code in (
+                TILE_METAL_BYTE,
+                TILE_BRICK_BYTE,
+                TILE_PLATFORM_BYTE,
+                TILE_LADDER_BYTE,
+                TILE_BOUNDARY_BYTE,
+            ):
+                sprite = convert_for_display(pygame.Surface((size, size)), alpha=False)
+                sprite.fill(_TILE_PAGE_COLORKEY)
+                self._draw_detailed_tile(
+                    sprite, pygame.Rect(0, 0, TILE_SIZE, TILE_SIZE), code
+                )
+                sprite.set_colorkey(_TILE_PAGE_COLORKEY)
+                sprites[code] = sprite
+            self._tile_sprite_cache = sprites
+        return self._tile_sprite_cache
+
+    def _repaint_tiles(self, left: int, top: int, right: int, bottom: int) -> None:
+        """Refresh already rendered pages covering the given tile range."""
+        for page_col in range(left // TILE_PAGE_TILES, right // TILE_PAGE_TILES + 1):
+            for page_row in range(
+                top // TILE_PAGE_TILES, bottom // TILE_PAGE_TILES + 1
+            ):
+                page = self._tile_pages.get((page_col, page_row))
+                if page is None:
                     continue
-                rect = pygame.Rect(
-                    tx * TILE_SIZE - int(self.camera_x),
-                    ty * TILE_SIZE - int(self.camera_y),
-                    TILE_SIZE,
-                    TILE_SIZE,
+                page_left = page_col * TILE_PAGE_TILES
+                page_top = page_row * TILE_PAGE_TILES
+                self._paint_page(
+                    page,
+                    page_col,
+                    page_row,
+                    (
+                        max(left, page_left),
+                        max(top, page_top),
+                        min(right, page_left + TILE_PAGE_TILES - 1),
+                        min(bottom, page_top + TILE_PAGE_TILES - 1),
+                    ),
                 )
-                self._draw_detailed_tile(surface, rect, t)
 
-    def _draw_foreground(self, surface: pygame.Surface) -> None:
-        factor_fore = 1.2
-        width = surface.get_width()
-        height = surface.get_height()
-        offset_fore = -int(self.camera_x * factor_fore) % (5 * TILE_SIZE)
-        for x in range(-offset_fore, width + 5 * TILE_SIZE, 5 * TILE_SIZE):
-            rect = pygame.Rect(x, height - 2 * TILE_SIZE, TILE_SIZE, 2 * TILE_SIZE)
-            pygame.draw.rect(surface, (12, 14, 18), rect)
+    def _draw_foreground(self, surface: pygame.Surface, cam_x: int) -> None:
+        self._draw_scenery(surface, cam_x, _SCENERY_FORE)
 
     def _draw_detailed_player(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
         """Draw a detailed player sprite with multiple colors and features."""
@@ -532,7 +959,7 @@ class SideScrollerScene(Scene, PlayerMixin):
             asset_path = asset_dir / "body" / f"{part}.png"
             if asset_path.exists():
                 try:
-                    assets[part] = pygame.image.load(str(asset_path)).convert_alpha()
+                    assets[part] = _load_converted_image(asset_path)
                 except pygame.error as e:
                     print(f"Warning: Could not load {part}: {e}")
 
@@ -547,7 +974,7 @@ class SideScrollerScene(Scene, PlayerMixin):
             asset_path = asset_dir / rel_path
             if asset_path.exists():
                 try:
-                    assets[part] = pygame.image.load(str(asset_path)).convert_alpha()
+                    assets[part] = _load_converted_image(asset_path)
                 except pygame.error as e:
                     print(f"Warning: Could not load {part}: {e}")
 
@@ -557,7 +984,7 @@ class SideScrollerScene(Scene, PlayerMixin):
             asset_path = asset_dir / "gear" / f"{part}.png"
             if asset_path.exists():
                 try:
-                    assets[part] = pygame.image.load(str(asset_path)).convert_alpha()
+                    assets[part] = _load_converted_image(asset_path)
                 except pygame.error as e:
                     print(f"Warning: Could not load {part}: {e}")
 
@@ -581,6 +1008,8 @@ class SideScrollerScene(Scene, PlayerMixin):
         # Calculate scaling factor (our rect is 104x120, assets are 256x256)
         scale_x = rect.width / 256.0
         scale_y = rect.height / 256.0
+        scaled_size = (int(256 * scale_x), int(256 * scale_y))
+        scale_asset = self._scaled_asset
 
         # Draw body parts in order (back to front) with relative positioning
         parts_order = [
@@ -595,9 +1024,7 @@ class SideScrollerScene(Scene, PlayerMixin):
         for part in parts_order:
             if part in assets:
                 # Scale the asset to fit our rect
-                scaled_asset = pygame.transform.scale(
-                    assets[part], (int(256 * scale_x), int(256 * scale_y))
-                )
+                scaled_asset = scale_asset(part, scaled_size)
 
                 # Position parts relative to the main rect, similar to _draw_detailed_player
                 asset_rect = scaled_asset.get_rect()
@@ -630,18 +1057,14 @@ class SideScrollerScene(Scene, PlayerMixin):
 
         # Draw facial features positioned relative to head
         if "eyes_open" in assets:
-            scaled_eyes = pygame.transform.scale(
-                assets["eyes_open"], (int(256 * scale_x), int(256 * scale_y))
-            )
+            scaled_eyes = scale_asset("eyes_open", scaled_size)
             eyes_rect = scaled_eyes.get_rect()
             eyes_rect.centerx = rect.centerx
             eyes_rect.centery = rect.centery - 25  # Above head center
             surface.blit(scaled_eyes, eyes_rect)
 
         if "mouth_neutral" in assets:
-            scaled_mouth = pygame.transform.scale(
-                assets["mouth_neutral"], (int(256 * scale_x), int(256 * scale_y))
-            )
+            scaled_mouth = scale_asset("mouth_neutral", scaled_size)
             mouth_rect = scaled_mouth.get_rect()
             mouth_rect.centerx = rect.centerx
             mouth_rect.centery = rect.centery - 15  # Below eyes
@@ -649,9 +1072,7 @@ class SideScrollerScene(Scene, PlayerMixin):
 
         # Draw gear positioned relative to head
         if "hat" in assets:
-            scaled_hat = pygame.transform.scale(
-                assets["hat"], (int(256 * scale_x), int(256 * scale_y))
-            )
+            scaled_hat = scale_asset("hat", scaled_size)
             hat_rect = scaled_hat.get_rect()
             hat_rect.centerx = rect.centerx
             hat_rect.centery = rect.centery - 35  # Above head
@@ -659,43 +1080,52 @@ class SideScrollerScene(Scene, PlayerMixin):
 
         # Center mass dot will be drawn after all other rendering
 
+    def _scaled_asset(self, name: str, size: Tuple[int, int]) -> pygame.Surface:
+        """Return a character asset scaled to size, scaling it only once."""
+        key = (name, size)
+        scaled = self._scaled_assets.get(key)
+        if scaled is None:
+            assert self._character_assets is not None
+            scaled = pygame.transform.scale(self._character_assets[name], size)
+            self._scaled_assets[key] = scaled
+        return scaled
+
     def _draw_detailed_tile(
-        self, surface: pygame.Surface, rect: pygame.Rect, tile_type: str
+        self, surface: pygame.Surface, rect: pygame.Rect, tile_type: int
     ) -> None:
         """Draw a detailed tile with texture and shading."""
-        if tile_type == TILE_METAL:
-            # Metal tile with rivets and shading
-            pygame.draw.rect(surface, (90, 95, 105), rect)
+        left, top, width, height = rect
+        if tile_type == TILE_METAL_BYTE:
+            # Metal tile with rivets and shading; solid rects are plain fills
+            surface.fill((90, 95, 105), rect)
             # Rivets
-            for i in range(0, rect.width, 32):
-                for j in range(0, rect.height, 32):
-                    rivet_rect = pygame.Rect(rect.x + i + 8, rect.y + j + 8, 8, 8)
-                    pygame.draw.rect(surface, (120, 125, 135), rivet_rect)
+            for i in range(left + 8, left + width + 8, 32):
+                for j in range(top + 8, top + height + 8, 32):
+                    surface.fill((120, 125, 135), (i, j, 8, 8))
             # Highlight
-            highlight_rect = pygame.Rect(rect.x, rect.y, rect.width, 4)
-            pygame.draw.rect(surface, (130, 135, 145), highlight_rect)
+            surface.fill((130, 135, 145), (left, top, width, 4))
 
-        elif tile_type == TILE_BRICK:
+        elif tile_type == TILE_BRICK_BYTE:
             render_brick_tile(surface, rect)
 
-        elif tile_type == TILE_PLATFORM:
+        elif tile_type == TILE_PLATFORM_BYTE:
             render_platform_tile(surface, rect)
 
-        elif tile_type == TILE_LADDER:
+        elif tile_type == TILE_LADDER_BYTE:
             render_ladder_tile(surface, rect)
 
-        elif tile_type == TILE_BOUNDARY:
+        elif tile_type == TILE_BOUNDARY_BYTE:
             # Boundary with warning pattern
-            pygame.draw.rect(surface, (70, 110, 150), rect)
+            surface.fill((70, 110, 150), rect)
             # Diagonal stripes
-            for i in range(0, rect.width + rect.height, 16):
-                start_x = max(0, i - rect.height)
-                end_x = min(rect.width, i)
+            for i in range(0, width + height, 16):
+                start_x = i - height if i > height else 0
+                end_x = i if i < width else width
                 if start_x < end_x:
-                    stripe_rect = pygame.Rect(
-                        rect.x + start_x, rect.y + i - start_x, end_x - start_x, 4
+                    surface.fill(
+                        (100, 140, 180),
+                        (left + start_x, top + i - start_x, end_x - start_x, 4),
                     )
-                    pygame.draw.rect(surface, (100, 140, 180), stripe_rect)
 
 
 class WorldScene(Scene):
@@ -706,42 +1136,55 @@ class WorldScene(Scene):
             app.width // 2 - 60, app.height // 2 - 60, 120, 120
         )  # 4x 30x30
         self.player_speed_px_per_sec: int = 240
+        # Pre-rendered (text, position) pairs blitted every frame
+        self._text_lines: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
 
     def on_enter(self) -> None:
         self.font = pygame.font.Font(None, 112)  # 4x 28 for higher resolution
 
+        text_lines = [
+            "Across the portal, ambition hardens into conquest.",
+            "Arrows/WASD to move. Esc to quit.",
+        ]
+        self._text_lines = [
+            (
+                convert_for_display(self.font.render(line, True, (210, 210, 220))),
+                (64, 64 + i * 96),  # 4x 16, 16 + i * 24 for higher resolution
+            )
+            for i, line in enumerate(text_lines)
+        ]
+
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
             self.app.request_quit()
 
     def update(self, delta_seconds: float) -> None:
-        keys = pygame.key.get_pressed()
-        movement_x = (keys[pygame.K_RIGHT] or keys[pygame.K_d]) - (
-            keys[pygame.K_LEFT] or keys[pygame.K_a]
-        )
-        movement_y = (keys[pygame.K_DOWN] or keys[pygame.K_s]) - (
-            keys[pygame.K_UP] or keys[pygame.K_w]
-        )
+        held = read_input_mask(pygame.key.get_pressed())
+        movement_x = bool(held & INPUT_RIGHT) - bool(held & INPUT_LEFT)
+        movement_y = bool(held & INPUT_DOWN) - bool(held & INPUT_UP)
 
         dx = int(movement_x * self.player_speed_px_per_sec * delta_seconds)
         dy = int(movement_y * self.player_speed_px_per_sec * delta_seconds)
+        prev_pos = self.player_rect.topleft
         self.player_rect.move_ip(dx, dy)
         self.player_rect.clamp_ip(pygame.Rect(0, 0, self.app.width, self.app.height))
+        if self.player_rect.topleft != prev_pos:
+            self.dirty = True
 
     def draw(self, surface: pygame.Surface) -> None:
         surface.fill((10, 10, 12))
         pygame.draw.rect(surface, (220, 80, 80), self.player_rect)
-        assert self.font is not None
+        surface.blits(self._text_lines, doreturn=False)
 
-        text_lines = [
-            "Across the portal, ambition hardens into conquest.",
-            "Arrows/WASD to move. Esc to quit.",
-        ]
-        for i, line in enumerate(text_lines):
-            rendered = self.font.render(line, True, (210, 210, 220))
-            surface.blit(
-                rendered, (64, 64 + i * 96)
-            )  # 4x 16, 16 + i * 24 for higher resolution
+
+class _PressedProxy:
+    """Emulates pygame.key.get_pressed() for a set of held key codes."""
+
+    def __init__(self, pressed_keys: AbstractSet[int]) -> None:
+        self.pressed_keys = pressed_keys
+
+    def __getitem__(self, key_code: int) -> int:
+        return 1 if key_code in self.pressed_keys else 0
 
 
 class GameApp:
@@ -753,6 +1196,8 @@ class GameApp:
         self.height = config.window_height
         self._running = True
         self._current_scene: Optional[Scene] = None
+        # Set when the next frame must be presented in full, not as dirty rects
+        self._present_full = True
 
         # Time provider - defaults to real time
         self._time_provider = time_provider or RealTimeProvider(config.target_fps)
@@ -763,7 +1208,9 @@ class GameApp:
 
         pygame.init()
         pygame.display.set_caption(config.window_title)
-        self._screen = pygame.display.set_mode((self.width, self.height))
+        self._screen = pygame.display.set_mode(
+            (self.width, self.height), pygame.DOUBLEBUF
+        )
 
         self.switch_scene(MenuScene(self))
 
@@ -772,28 +1219,56 @@ class GameApp:
             self._current_scene.on_exit()
         self._current_scene = scene
         self._current_scene.on_enter()
+        self._current_scene.dirty = True
+        self._present_full = True
 
     def request_quit(self) -> None:
         self._running = False
 
     def run(self, max_frames: Optional[int] = None) -> int:
         frames_rendered = 0
+        # Hoist the event dispatch lookups out of the loop; the scene handler
+        # is rebound only when a handler switches scenes
+        get_events = pygame.event.get
+        quit_event = pygame.QUIT
+        keydown_event = pygame.KEYDOWN
+        escape_key = pygame.K_ESCAPE
+        expose_events = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+        scene = self._current_scene
+        handle_event = scene.handle_event if scene is not None else None
         while self._running:
             delta_seconds = self._time_provider.get_delta_seconds()
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+            for event in get_events():
+                event_type = event.type
+                if event_type == quit_event:
                     self._running = False
-                elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                elif event_type == keydown_event and event.key == escape_key:
                     self._running = False
-                elif self._current_scene is not None:
-                    self._current_scene.handle_event(event)
-
-            if self._current_scene is not None:
-                self._current_scene.update(delta_seconds)
-                self._current_scene.draw(self._screen)
-
-            pygame.display.flip()
+                elif handle_event is not None:
+                    if event_type in expose_events:
+                        # The window contents were lost; repaint even if idle
+                        scene.dirty = True  # type: ignore[union-attr]
+                        self._present_full = True
+                    handle_event(event)
+                    if self._current_scene is not scene:
+                        scene = self._current_scene
+                        handle_event = scene.handle_event if scene is not None else None
+
+            # Only redraw and flip when the scene reports a visible change
+            if scene is not self._current_scene:
+                scene = self._current_scene
+                handle_event = scene.handle_event if scene is not None else None
+            if scene is not None:
+                scene.update(delta_seconds)
+                if scene.dirty:
+                    dirty_rects = scene.draw(self._screen)
+                    if dirty_rects is None or self._present_full:
+                        pygame.display.flip()
+                        self._present_full = False
+                    else:
+                        present(self._screen, dirty_rects)
+                    scene.dirty = False
 
             if max_frames is not None:
                 frames_rendered += 1
@@ -808,75 +1283,98 @@ class GameApp:
         total_frames: int,
         keys_for_frame: Optional[Callable[[int], set[int]]] = None,
         capture_callback: Optional[Callable[[int, pygame.Surface], None]] = None,
+        key_plan: Optional[Sequence[Iterable[int]]] = None,
     ) -> int:
         """
         Deterministic, headless-friendly loop for test scenarios.
         - keys_for_frame(frame_index) -> Set[int] of pygame.K_* to hold pressed
         - capture_callback(frame_index, surface) -> None to save screenshots
+        - key_plan[frame_index] -> keys to hold, precomputed for the whole run;
+          takes precedence over keys_for_frame, frames past its end hold none
         """
         # Use controlled time provider for deterministic testing
         controlled_time = ControlledTimeProvider(1.0 / float(self.config.target_fps))
         original_time_provider = self._time_provider
         self._time_provider = controlled_time
-        pressed_prev: set[int] = set()
-
-        # Provide a proxy that emulates pygame.key.get_pressed() based on a dynamic set
-        class _PressedProxy:
-            def __init__(self, pressed_keys: set[int]) -> None:
-                self._pressed_keys = pressed_keys
-
-            def __getitem__(self, key_code: int) -> int:
-                return 1 if key_code in self._pressed_keys else 0
-
+        # One proxy serves the whole run; it is pointed at each new key set
+        no_keys: frozenset[int] = frozenset()
+        held = no_keys
+        proxy = _PressedProxy(held)
         original_get_pressed = pygame.key.get_pressed
+        pygame.key.get_pressed = lambda: proxy  # type: ignore[assignment,return-value]
+        plan = (
+            [frozenset(keys) for keys in key_plan[:total_frames]]
+            if key_plan is not None
+            else None
+        )
+        get_events = pygame.event.get
+        quit_event = pygame.QUIT
+        keydown_event = pygame.KEYDOWN
+        escape_key = pygame.K_ESCAPE
+        scene = self._current_scene
+        handle_event = scene.handle_event if scene is not None else None
 
         for frame in range(total_frames):
-            desired_pressed: set[int] = set()
-            if keys_for_frame is not None:
+            desired_pressed = no_keys
+            if plan is not None:
+                if frame < len(plan):
+                    desired_pressed = plan[frame]
+            elif keys_for_frame is not None:
                 try:
                     desired = keys_for_frame(frame)
                     if desired:
-                        desired_pressed = set(desired)
+                        desired_pressed = frozenset(desired)
                 except Exception:
-                    desired_pressed = set()
-
-            # Inject synthetic KEYDOWN/KEYUP events to mirror desired key state
-            # Issue KEYUP for keys no longer pressed
-            for key in pressed_prev - desired_pressed:
-                pygame.event.post(pygame.event.Event(pygame.KEYUP, {"key": key}))
-            # Issue KEYDOWN for newly pressed keys
-            for key in desired_pressed - pressed_prev:
-                pygame.event.post(pygame.event.Event(pygame.KEYDOWN, {"key": key}))
-            pressed_prev = desired_pressed
-
-            # Monkey-patch get_pressed to reflect our desired state for this frame
-            pygame.key.get_pressed = lambda: _PressedProxy(desired_pressed)  # type: ignore[assignment,return-value]
+                    desired_pressed = no_keys
+
+            # Inject synthetic KEYDOWN/KEYUP events only when the held keys
+            # change, which is rare compared to frames
+            if desired_pressed != held:
+                # Issue KEYUP for keys no longer pressed
+                for key in held - desired_pressed:
+                    pygame.event.post(pygame.event.Event(pygame.KEYUP, {"key": key}))
+                # Issue KEYDOWN for newly pressed keys
+                for key in desired_pressed - held:
+                    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, {"key": key}))
+                # get_pressed() now reports this frame's keys
+                held = desired_pressed
+                proxy.pressed_keys = held
 
             # Process event queue
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+            for event in get_events():
+                event_type = event.type
+                if event_type == quit_event:
                     pygame.key.get_pressed = original_get_pressed  # restore
                     return 0
-                elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                elif event_type == keydown_event and event.key == escape_key:
                     pygame.key.get_pressed = original_get_pressed  # restore
                     return 0
-                elif self._current_scene is not None:
-                    self._current_scene.handle_event(event)
+                elif handle_event is not None:
+                    handle_event(event)
+                    if self._current_scene is not scene:
+                        scene = self._current_scene
+                        handle_event = scene.handle_event if scene is not None else None
 
             # Update and draw
-            if self._current_scene is not None:
+            if scene is not self._current_scene:
+                scene = self._current_scene
+                handle_event = scene.handle_event if scene is not None else None
+            if scene is not None:
                 delta_seconds = self._time_provider.get_delta_seconds()
-                self._current_scene.update(delta_seconds)
-                self._current_scene.draw(self._screen)
-
-            pygame.display.flip()
+                scene.update(delta_seconds)
+                scene.draw(self._screen)
 
+            # Nobody looks at the window between headless frames, so only
+            # present when a capture is taken
             if capture_callback is not None:
+                pygame.display.flip()
                 capture_callback(frame, self._screen)
 
         # Restore original get_pressed and time provider after loop
         pygame.key.get_pressed = original_get_pressed
         self._time_provider = original_time_provider
+        # The window may not show the last drawn frame yet
+        self._present_full = True
         return 0
 
     def advance_frame(self, keys: Optional[set[int]] = None) -> None:
@@ -884,6 +1382,22 @@ class GameApp:
         Advance the game by exactly one frame with controlled time.
         This allows precise control over when frames are rendered for testing.
         """
+        self._step_logic(keys)
+
+        if self._current_scene is not None:
+            self._current_scene.draw(self._screen)
+
+        pygame.display.flip()
+
+    def advance_frame_headless(self, keys: Optional[set[int]] = None) -> None:
+        """
+        Advance the game by one frame like advance_frame, without drawing.
+        For tests that never look at the screen between frames.
+        """
+        self._step_logic(keys)
+
+    def _step_logic(self, keys: Optional[set[int]]) -> None:
+        """Feed the frame's input to the scene and update it with controlled time."""
         if not isinstance(self._time_provider, ControlledTimeProvider):
             raise RuntimeError(
                 "advance_frame() can only be used with ControlledTimeProvider"
@@ -899,14 +1413,8 @@ class GameApp:
                 pygame.event.post(pygame.event.Event(pygame.KEYDOWN, {"key": key}))
 
             # Monkey-patch get_pressed to reflect our desired state
-            class _PressedProxy:
-                def __init__(self, pressed_keys: set[int]) -> None:
-                    self._pressed_keys = pressed_keys
-
-                def __getitem__(self, key_code: int) -> int:
-                    return 1 if key_code in self._pressed_keys else 0
-
-            pygame.key.get_pressed = lambda: _PressedProxy(keys)  # type: ignore[assignment,return-value]
+            proxy = _PressedProxy(keys)
+            pygame.key.get_pressed = lambda: proxy  # type: ignore[assignment,return-value]
 
         # Process events
         for event in pygame.event.get():
@@ -917,14 +1425,11 @@ class GameApp:
             elif self._current_scene is not None:
                 self._current_scene.handle_event(event)
 
-        # Update and draw
+        # Update
         if self._current_scene is not None:
             delta_seconds = self._time_provider.get_delta_seconds()
             self._time_provider.advance_time(delta_seconds)
             self._current_scene.update(delta_seconds)
-            self._current_scene.draw(self._screen)
-
-        pygame.display.flip()
 
     def get_current_time(self) -> float:
         """Get the current time from the time provider."""
@@ -953,21 +1458,24 @@ class GameApp:
         if scene is None or not isinstance(scene, SideScrollerScene):
             return
 
+        cam_x = int(scene.camera_x)
+        cam_y = int(scene.camera_y)
+
         # Sky
-        surface.fill((18, 22, 30))
+        surface.fill(_SKY_COLOR)
 
         # Skip parallax backgrounds for clean test screenshots
-        # scene._draw_parallax(surface)
+        # scene._draw_parallax(surface, cam_x)
 
         # World tiles in view
-        scene._draw_tiles(surface)
+        scene._draw_tiles(surface, cam_x, cam_y)
 
         # Player (drawn after tiles but before foreground)
-        pr = scene.player_rect.move(-int(scene.camera_x), -int(scene.camera_y))
+        pr = scene.player_rect.move(-cam_x, -cam_y)
         scene._draw_procedural_player(surface, pr)
 
         # Skip foreground accents for clean test screenshots
-        # scene._draw_foreground(surface)
+        # scene._draw_foreground(surface, cam_x)
 
         # Note: Skip HUD rendering for clean screenshots
         # Also skip center mass dot for clean screenshots
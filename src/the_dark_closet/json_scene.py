@@ -5,13 +5,42 @@ JSON-based scene implementation.
 This scene uses level JSON files to define object placement and rendering.
 """
 
+from bisect import bisect_left, bisect_right
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
 import pygame
 
-from .game import Scene, GameApp, TILE_SIZE
-from .level_loader import LevelData, LevelRenderer
-from .rendering_utils import render_hud, render_center_mass_dot, PlayerMixin
+from .game import (
+    Scene,
+    GameApp,
+    TILE_SIZE,
+    INPUT_LEFT,
+    INPUT_RIGHT,
+    INPUT_UP,
+    INPUT_JUMP,
+    read_input_mask,
+)
+from .level_loader import LevelData, LevelObject, LevelRenderer
+from .rendering_utils import (
+    render_hud,
+    render_hud_text,
+    render_center_mass_dot,
+    convert_for_display,
+    PlayerMixin,
+)
+
+# Level layers, back to front
+_LAYER_ORDER = ("background", "midground", "tiles", "foreground")
+
+# Body part assets and their offsets from the player rect, in draw order
+_PLAYER_PART_OFFSETS = (
+    ("head", 20, 10),
+    ("torso", 20, 80),
+    ("left_arm", 5, 85),
+    ("right_arm", 79, 85),
+    ("left_leg", 20, 150),
+    ("right_leg", 64, 150),
+)
 
 
 class JSONScene(Scene, PlayerMixin):
@@ -35,21 +64,54 @@ class JSONScene(Scene, PlayerMixin):
         else:
             spawn_x, spawn_y = self.level_data.player_spawn
 
-        # Character assets (lazy loaded)
+        # Character assets (lazy loaded), and the area their visible pixels
+        # cover relative to the top left of the player rect
         self._character_assets: Optional[Dict[str, pygame.Surface]] = None
+        self._sprite_bounds = pygame.Rect(0, 0, 0, 0)
 
         # Initialize player state using shared configuration
         self._init_player_state(spawn_x, spawn_y)
 
-        # Initialize HUD font immediately
+        # Initialize HUD font immediately; the controls text never changes, so
+        # it is rasterized once here instead of every frame
         self.hud_font = pygame.font.Font(None, 96)  # 4x 24 for higher resolution
+        self._hud_text = render_hud_text(self.hud_font)
 
         # Level dimensions
         self.level_width = self.level_data.metadata.get("width", 12) * TILE_SIZE
         self.level_height = self.level_data.metadata.get("height", 8) * TILE_SIZE
+        # Camera limits; the view size is fixed for the life of the app
+        self._half_view_w = self.app.width // 2
+        self._half_view_h = self.app.height // 2
+        self._max_camera_x = self.level_width - self.app.width
+        self._max_camera_y = self.level_height - self.app.height
+
+        # Only bricks in the bottom two rows can be landed on. Keep them with
+        # their level order, sorted by left edge for bisecting under the player
+        ground_top = self.level_height - 256
+        self._ground_bricks: List[Tuple[int, LevelObject]] = sorted(
+            (
+                (order, brick)
+                for order, brick in enumerate(
+                    self.level_data.get_objects_by_type("brick")
+                )
+                if brick.y >= ground_top
+            ),
+            key=lambda entry: entry[1].x,
+        )
+        self._ground_lefts = [brick.x for _, brick in self._ground_bricks]
+        self._ground_rects = [brick.get_rect() for _, brick in self._ground_bricks]
+        self._ground_max_width = max(
+            (brick.width for _, brick in self._ground_bricks), default=0
+        )
+
+        # What the previous draw put on screen, used to report dirty rects
+        self._drawn_view: Optional[Tuple[float, float, bool]] = None
+        self._drawn_sprite_area: Optional[pygame.Rect] = None
 
     def on_enter(self) -> None:
         self.hud_font = pygame.font.Font(None, 96)  # 4x 24 for higher resolution
+        self._hud_text = render_hud_text(self.hud_font)
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
@@ -58,20 +120,18 @@ class JSONScene(Scene, PlayerMixin):
 
     def update(self, delta_seconds: float) -> None:
         """Update game logic."""
-        keys = pygame.key.get_pressed()
+        held = read_input_mask(pygame.key.get_pressed())
+        prev_pos = self.player_rect.topleft
+        prev_camera = (self.camera_x, self.camera_y)
 
         # Movement
-        movement_x = (keys[pygame.K_RIGHT] or keys[pygame.K_d]) - (
-            keys[pygame.K_LEFT] or keys[pygame.K_a]
-        )
+        movement_x = bool(held & INPUT_RIGHT) - bool(held & INPUT_LEFT)
 
         # Apply movement
         self.player_velocity_x = movement_x * self.player_speed_px_per_sec
 
         # Jumping
-        if (
-            keys[pygame.K_SPACE] or keys[pygame.K_UP] or keys[pygame.K_w]
-        ) and self.on_ground:
+        if held & (INPUT_JUMP | INPUT_UP) and self.on_ground:
             self.player_velocity_y = -self.player_jump_speed_px_per_sec
             self.on_ground = False
 
@@ -89,83 +149,98 @@ class JSONScene(Scene, PlayerMixin):
         # Update camera to follow player
         self._update_camera()
 
+        if (
+            self.player_rect.topleft != prev_pos
+            or (self.camera_x, self.camera_y) != prev_camera
+        ):
+            self.dirty = True
+
     def _check_collisions(self) -> None:
         """Check collisions with level objects."""
-        # Get all active brick objects for collision
-        brick_objects = [
-            obj
-            for obj in self.level_data.get_objects_by_type("brick")
-            if obj.is_active()
-        ]
-
-        # Check ground collision
+        player_rect = self.player_rect
         self.on_ground = False
-        player_bottom = self.player_rect.bottom
-
-        for brick in brick_objects:
-            brick_rect = brick.get_rect()
-
-            # Check if player is standing on brick (only for ground-level bricks)
-            if (
-                self.player_rect.colliderect(brick_rect)
-                and player_bottom <= brick_rect.top + 10
-                and self.player_velocity_y >= 0
-                and brick_rect.y >= self.level_height - 256
-            ):  # Only ground-level bricks
-                self.player_rect.bottom = brick_rect.top
+        if self.player_velocity_y >= 0:
+            # Check ground collision (only for ground-level bricks)
+            ground_rect = self._ground_brick_under(player_rect)
+            if ground_rect is not None:
+                player_rect.bottom = ground_rect.top
                 self.player_velocity_y = 0
                 self.on_ground = True
-                break
-
-        # Check for brick breaking (jumping up into bricks)
-        for brick in brick_objects:
-            brick_rect = brick.get_rect()
-
-            # Check if player is hitting brick from below while jumping
-            if (
-                self.player_rect.colliderect(brick_rect)
-                and self.player_velocity_y < 0  # Moving upward
-                and self.player_rect.top < brick_rect.bottom
-                and self.player_rect.bottom > brick_rect.top
-            ):
-                print(f"Breaking brick {brick.id} at {brick_rect}")
-                # Trigger OnBreak callback
-                brick.trigger_callback("OnBreak", brick)
-                # Deactivate the brick
-                brick.deactivate()
-                break
+        else:
+            # Moving upward into a brick breaks the first one hit
+            for brick in self.level_data.query_bricks(player_rect):
+                if brick.active and player_rect.colliderect(brick.get_rect()):
+                    print(f"Breaking brick {brick.id} at {brick.get_rect()}")
+                    # Trigger OnBreak callback
+                    brick.trigger_callback("OnBreak", brick)
+                    # Deactivate the brick
+                    brick.deactivate()
+                    self.dirty = True
+                    # Present the next frame in full so the brick disappears
+                    self._drawn_view = None
+                    break
 
         # Gravity is now handled in update method
 
         # Keep player within level bounds (but allow movement)
-        self.player_rect.x = max(
-            0, min(self.player_rect.x, self.level_width - self.player_rect.width)
-        )
+        player_rect.x = max(0, min(player_rect.x, self.level_width - player_rect.width))
         # Don't constrain Y position to allow jumping
 
+    def _ground_brick_under(self, player_rect: pygame.Rect) -> Optional[pygame.Rect]:
+        """Return the rect of the ground brick the player lands on, if any.
+
+        Among the active ground bricks the player overlaps with its feet no
+        more than 10 px into the top, the first in level order wins.
+        """
+        lefts = self._ground_lefts
+        # Bricks starting at or before left - widest brick end before the player
+        first = bisect_right(lefts, player_rect.left - self._ground_max_width)
+        last = bisect_left(lefts, player_rect.right)
+        ground_bricks = self._ground_bricks
+        ground_rects = self._ground_rects
+        player_bottom = player_rect.bottom
+        best_order = -1
+        best_rect = None
+        # Overlap tests run in C; only actual hits come back to Python
+        for i in player_rect.collidelistall(ground_rects[first:last]):
+            order, brick = ground_bricks[first + i]
+            brick_rect = ground_rects[first + i]
+            if (
+                brick.active
+                and player_bottom <= brick_rect.top + 10
+                and (best_order < 0 or order < best_order)
+            ):
+                best_order = order
+                best_rect = brick_rect
+        return best_rect
+
     def _update_camera(self) -> None:
         """Update camera position to follow player."""
-        # Center camera on player
-        target_camera_x = self.player_rect.centerx - self.app.width // 2
-        target_camera_y = self.player_rect.centery - self.app.height // 2
-
-        # Keep camera within level bounds
-        self.camera_x = max(0, min(target_camera_x, self.level_width - self.app.width))
-        self.camera_y = max(
-            0, min(target_camera_y, self.level_height - self.app.height)
-        )
-
-    def draw(self, surface: pygame.Surface, show_hud: bool = True) -> None:
+        # Center camera on player, pinned to the top left when the level is
+        # smaller than the view
+        player_rect = self.player_rect
+        camera_x = player_rect.x + (player_rect.width >> 1) - self._half_view_w
+        camera_y = player_rect.y + (player_rect.height >> 1) - self._half_view_h
+        if camera_x > self._max_camera_x:
+            camera_x = self._max_camera_x
+        if camera_x < 0:
+            camera_x = 0
+        if camera_y > self._max_camera_y:
+            camera_y = self._max_camera_y
+        if camera_y < 0:
+            camera_y = 0
+        self.camera_x = camera_x
+        self.camera_y = camera_y
+
+    def draw(
+        self, surface: pygame.Surface, show_hud: bool = True
+    ) -> Optional[List[pygame.Rect]]:
         """Draw the scene."""
         # Sky
         surface.fill((18, 22, 30))
 
         # Render layers in order
-        layer_order = ["background", "midground", "tiles", "foreground"]
-        for layer_name in layer_order:
-            self.level_renderer.render_layer(
-                surface, layer_name, self.camera_x, self.camera_y
-            )
+        self.level_renderer.render(surface, _LAYER_ORDER, self.camera_x, self.camera_y)
 
         # Player
         pr = self.player_rect.move(-int(self.camera_x), -int(self.camera_y))
@@ -173,11 +248,22 @@ class JSONScene(Scene, PlayerMixin):
 
         # HUD (optional)
         if show_hud:
-            render_hud(surface, self.hud_font)
+            render_hud(surface, self.hud_font, self._hud_text)
 
         # Draw center mass dot after all other rendering (so it's not overwritten)
         render_center_mass_dot(surface, self.player_rect, self.camera_x, self.camera_y)
 
+        # With a still camera only the player's old and new areas changed;
+        # the player rect itself covers the fallback drawing and the dot
+        view = (self.camera_x, self.camera_y, show_hud)
+        sprite_area = pr.union(self._sprite_bounds.move(pr.topleft))
+        dirty_rects: Optional[List[pygame.Rect]] = None
+        if view == self._drawn_view and self._drawn_sprite_area:
+            dirty_rects = [self._drawn_sprite_area, sprite_area]
+        self._drawn_view = view
+        self._drawn_sprite_area = sprite_area
+        return dirty_rects
+
     def _draw_procedural_player(
         self, surface: pygame.Surface, rect: pygame.Rect
     ) -> None:
@@ -185,6 +271,7 @@ class JSONScene(Scene, PlayerMixin):
         # Load assets if not already loaded
         if self._character_assets is None:
             self._character_assets = self._load_character_assets()
+            self._sprite_bounds = self._measure_sprite_bounds(self._character_assets)
 
         assets = self._character_assets
         if not assets:
@@ -192,48 +279,34 @@ class JSONScene(Scene, PlayerMixin):
             pygame.draw.rect(surface, (220, 80, 80), rect)
             return
 
-        # Draw character parts
-        head_rect = pygame.Rect(rect.x + 20, rect.y + 10, 88, 88)
-        surface.blit(assets["head"], head_rect)
-
-        torso_rect = pygame.Rect(rect.x + 20, rect.y + 80, 88, 88)
-        surface.blit(assets["torso"], torso_rect)
-
-        # Arms
-        left_arm_rect = pygame.Rect(rect.x + 5, rect.y + 85, 44, 44)
-        surface.blit(assets["left_arm"], left_arm_rect)
-
-        right_arm_rect = pygame.Rect(rect.x + 79, rect.y + 85, 44, 44)
-        surface.blit(assets["right_arm"], right_arm_rect)
-
-        # Legs
-        left_leg_rect = pygame.Rect(rect.x + 20, rect.y + 150, 44, 44)
-        surface.blit(assets["left_leg"], left_leg_rect)
+        # Draw character parts back to front in a single batch
+        x, y = rect.topleft
+        surface.blits(
+            [(assets[part], (x + dx, y + dy)) for part, dx, dy in _PLAYER_PART_OFFSETS],
+            doreturn=False,
+        )
 
-        right_leg_rect = pygame.Rect(rect.x + 64, rect.y + 150, 44, 44)
-        surface.blit(assets["right_leg"], right_leg_rect)
+    @staticmethod
+    def _measure_sprite_bounds(assets: Dict[str, pygame.Surface]) -> pygame.Rect:
+        """Get the visible area of the body parts, relative to the player rect."""
+        if not assets:
+            return pygame.Rect(0, 0, 0, 0)
+        part_rects = [
+            assets[part].get_bounding_rect().move(dx, dy)
+            for part, dx, dy in _PLAYER_PART_OFFSETS
+        ]
+        return part_rects[0].unionall(part_rects[1:])
 
     def _load_character_assets(self) -> Dict[str, pygame.Surface]:
-        """Load character assets from the generated assets directory."""
+        """Load character assets straight from the in-memory generator."""
         try:
-            from .assets import generate_character_assets
-
-            # Use a consistent assets directory for this scene instance
-            if not hasattr(self, "_assets_dir"):
-                self._assets_dir = Path("build/generated_assets")
-                self._assets_dir.mkdir(parents=True, exist_ok=True)
-
-                # Generate assets only once
-                asset_paths = generate_character_assets(self._assets_dir)
-                self._asset_paths = asset_paths
-
-            # Load the generated assets
-            assets = {}
-            for asset_name, asset_path in self._asset_paths.items():
-                if Path(asset_path).exists():
-                    assets[asset_name] = pygame.image.load(asset_path)
+            from .assets import generate_character_surfaces
 
-            return assets
+            # Nothing is written to or read back from disk here
+            return {
+                asset_name: convert_for_display(surface)
+                for asset_name, surface in generate_character_surfaces().items()
+            }
         except Exception as e:
             print(f"Failed to load character assets: {e}")
             return {}
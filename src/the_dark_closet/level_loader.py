@@ -6,15 +6,95 @@ object placement across different rendering layers.
 """
 
 import json
+import os
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple, Callable
+from typing import Dict, List, Any, Optional, Sequence, Set, Tuple, Callable
 import pygame
-from .rendering_utils import render_brick_tile, render_platform_tile, render_ladder_tile
+from .rendering_utils import (
+    render_brick_tile,
+    render_platform_tile,
+    render_ladder_tile,
+    convert_for_display,
+)
+
+# Side length in pixels of the cells bricks are bucketed into for collision queries
+BRICK_GRID_CELL_SIZE = 128
+
+# Transparent color of cached tile sprites; never produced by the tile artwork
+_SPRITE_COLORKEY = (255, 0, 254)
+# Offset brick rows can spill up to one brick width past the right tile edge
+_SPRITE_OVERHANG = 32
+# Layers without bricks are pre-composited into one surface up to this size
+_MAX_BAKED_LAYER_PIXELS = 4096 * 1024
+
+
+@lru_cache(maxsize=16)
+def _parse_level(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a level file once per on-disk version; treat the result as read-only."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# Tile artwork painted once per (painter, width, height) and shared by every
+# renderer, so reloading a level or switching scenes never repaints tiles
+_tile_sprites: Dict[
+    Tuple[Callable[[pygame.Surface, pygame.Rect], None], int, int], pygame.Surface
+] = {}
+# Keys of sprites painted before a display mode was set, which could not be
+# converted to the display format yet
+_unconverted_tile_sprites: Set[
+    Tuple[Callable[[pygame.Surface, pygame.Rect], None], int, int]
+] = set()
+
+
+def _tile_sprite(
+    painter: Callable[[pygame.Surface, pygame.Rect], None], width: int, height: int
+) -> pygame.Surface:
+    """Return the colorkeyed sprite ``painter`` draws for a tile of this size.
+
+    Sprites painted before the display existed are repainted once it does, so
+    blits never convert pixel formats on the fly.
+    """
+    key = (painter, width, height)
+    sprite = _tile_sprites.get(key)
+    if sprite is None or (
+        key in _unconverted_tile_sprites and pygame.display.get_surface() is not None
+    ):
+        sprite = convert_for_display(
+            pygame.Surface((width + _SPRITE_OVERHANG, height)), alpha=False
+        )
+        sprite.fill(_SPRITE_COLORKEY)
+        painter(sprite, pygame.Rect(0, 0, width, height))
+        sprite.set_colorkey(_SPRITE_COLORKEY)
+        _tile_sprites[key] = sprite
+        if pygame.display.get_surface() is None:
+            _unconverted_tile_sprites.add(key)
+        else:
+            _unconverted_tile_sprites.discard(key)
+    return sprite
 
 
 class LevelObject:
     """Represents a single object in a level layer."""
 
+    # Levels can hold thousands of objects; skip the per-instance __dict__
+    __slots__ = (
+        "id",
+        "type",
+        "x",
+        "y",
+        "width",
+        "height",
+        "_rect",
+        "color",
+        "properties",
+        "_active",
+        "_layer",
+        "callbacks",
+    )
+
     def __init__(self, obj_data: Dict[str, Any]):
         self.id: str = obj_data["id"]
         self.type: str = obj_data["type"]
@@ -22,9 +102,13 @@ class LevelObject:
         self.y: int = obj_data["y"]
         self.width: int = obj_data["width"]
         self.height: int = obj_data["height"]
+        # Objects never move after load, so one Rect serves every lookup
+        self._rect = pygame.Rect(self.x, self.y, self.width, self.height)
         self.color: Optional[Tuple[int, int, int]] = None
         self.properties: Dict[str, Any] = {}
-        self.active: bool = True  # Whether object is active/visible
+        self._active = True  # Whether object is active/visible
+        # Layer holding the object, told when it is shown or hidden
+        self._layer: Optional["LevelLayer"] = None
         self.callbacks: Dict[str, Callable] = {}  # Action callbacks
 
         # Extract color if present
@@ -37,17 +121,18 @@ class LevelObject:
                 self.properties[key] = value
 
     def get_rect(self) -> pygame.Rect:
-        """Get the pygame Rect for this object."""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        """Get the pygame Rect for this object.
+
+        The Rect is shared between calls and must not be modified; copy it first.
+        """
+        return self._rect
 
     def get_rect_with_camera(
         self, camera_x: float, camera_y: float, parallax_factor: float = 1.0
     ) -> pygame.Rect:
         """Get the pygame Rect with camera and parallax offset applied."""
-        offset_x = int(camera_x * parallax_factor)
-        offset_y = int(camera_y * parallax_factor)
-        return pygame.Rect(
-            self.x - offset_x, self.y - offset_y, self.width, self.height
+        return self._rect.move(
+            -int(camera_x * parallax_factor), -int(camera_y * parallax_factor)
         )
 
     def register_callback(self, action: str, callback: Callable) -> None:
@@ -60,6 +145,23 @@ class LevelObject:
             return self.callbacks[action](*args, **kwargs)
         return None
 
+    @property
+    def active(self) -> bool:
+        """Whether the object is visible and interactive."""
+        return self._active
+
+    @active.setter
+    def active(self, value: bool) -> None:
+        if value != self._active:
+            self._active = value
+            # Pre-composited images of the layer no longer match it
+            if self._layer is not None:
+                self._layer._version += 1
+
+    def activate(self) -> None:
+        """Activate the object (make it visible and interactive again)."""
+        self.active = True
+
     def deactivate(self) -> None:
         """Deactivate the object (make it invisible and non-interactive)."""
         self.active = False
@@ -72,32 +174,69 @@ class LevelObject:
 class LevelLayer:
     """Represents a single rendering layer in a level."""
 
+    __slots__ = (
+        "parallax_factor",
+        "objects",
+        "_bounds",
+        "_x_order",
+        "_lefts",
+        "_max_width",
+        "_version",
+    )
+
     def __init__(self, layer_data: Dict[str, Any]):
         self.parallax_factor: float = layer_data.get("parallax_factor", 1.0)
         self.objects: List[LevelObject] = []
 
         for obj_data in layer_data.get("objects", []):
-            self.objects.append(LevelObject(obj_data))
+            obj = LevelObject(obj_data)
+            obj._layer = self
+            self.objects.append(obj)
+        # Bumped whenever one of the objects is activated or deactivated
+        self._version = 0
+
+        # World-space (left, top, right, bottom) of each object, parallel to
+        # self.objects, so culling never touches the objects themselves
+        self._bounds: List[Tuple[int, int, int, int]] = [
+            (obj.x, obj.y, obj.x + obj.width, obj.y + obj.height)
+            for obj in self.objects
+        ]
+        # Object indices sorted by left edge, so culling can bisect to the
+        # objects that may reach the view horizontally
+        self._x_order: List[int] = sorted(
+            range(len(self._bounds)), key=lambda i: self._bounds[i][0]
+        )
+        self._lefts: List[int] = [self._bounds[i][0] for i in self._x_order]
+        self._max_width: int = max((obj.width for obj in self.objects), default=0)
 
     def get_objects_in_view(
         self, camera_x: float, camera_y: float, screen_width: int, screen_height: int
     ) -> List[LevelObject]:
         """Get objects that are visible in the current camera view."""
-        visible_objects = []
-
-        for obj in self.objects:
-            rect = obj.get_rect_with_camera(camera_x, camera_y, self.parallax_factor)
-
-            # Check if object is in view
-            if (
-                rect.right > 0
-                and rect.left < screen_width
-                and rect.bottom > 0
-                and rect.top < screen_height
-            ):
-                visible_objects.append(obj)
+        # Compare against the view in layer space instead of moving every object
+        view_left = int(camera_x * self.parallax_factor)
+        view_top = int(camera_y * self.parallax_factor)
+        return self._cull(
+            view_left, view_top, view_left + screen_width, view_top + screen_height
+        )
 
-        return visible_objects
+    def _cull(
+        self, view_left: int, view_top: int, view_right: int, view_bottom: int
+    ) -> List[LevelObject]:
+        """Get the objects overlapping a view given in layer space."""
+        # Objects starting at or before view_left - max width end before the view
+        first = bisect_right(self._lefts, view_left - self._max_width)
+        last = bisect_left(self._lefts, view_right)
+        bounds = self._bounds
+        visible = []
+        for i in self._x_order[first:last]:
+            _, top, right, bottom = bounds[i]
+            if right > view_left and bottom > view_top and top < view_bottom:
+                visible.append(i)
+        # Keep the layer's draw order
+        visible.sort()
+        objects = self.objects
+        return [objects[i] for i in visible]
 
 
 class LevelData:
@@ -108,16 +247,24 @@ class LevelData:
         self.metadata: Dict[str, Any] = {}
         self.layers: Dict[str, LevelLayer] = {}
         self.player_spawn: Tuple[int, int] = (0, 0)
+        # Objects across all layers, flat and grouped by type, in level order
+        self._all_objects: List[LevelObject] = []
+        self._by_type: Dict[str, List[LevelObject]] = {}
+        # Bricks in level order, and the indices of those overlapping each cell
+        self._bricks: List[LevelObject] = []
+        self._brick_grid: Dict[Tuple[int, int], List[int]] = {}
 
         self._load_level()
 
     def _load_level(self) -> None:
         """Load level data from JSON file."""
-        with open(self.path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        # Scenes are rebuilt from the same files over and over in tests, so
+        # reuse the parsed JSON until the file changes
+        stat = os.stat(self.path)
+        data = _parse_level(str(self.path), stat.st_mtime_ns, stat.st_size)
 
         # Load metadata
-        self.metadata = data.get("metadata", {})
+        self.metadata = dict(data.get("metadata", {}))
 
         # Load layers
         layers_data = data.get("layers", {})
@@ -131,25 +278,58 @@ class LevelData:
             player_data.get("spawn_y", 0),
         )
 
+        self._all_objects = [
+            obj for layer in self.layers.values() for obj in layer.objects
+        ]
+        self._by_type = {}
+        for obj in self._all_objects:
+            self._by_type.setdefault(obj.type, []).append(obj)
+        self._build_brick_grid()
+
+    def _build_brick_grid(self) -> None:
+        """Bucket every brick into the grid cells its rect overlaps."""
+        cell = BRICK_GRID_CELL_SIZE
+        self._bricks = self._by_type.get("brick", [])
+        self._brick_grid = {}
+        for index, brick in enumerate(self._bricks):
+            if brick.width <= 0 or brick.height <= 0:
+                continue
+            for cy in range(brick.y // cell, (brick.y + brick.height - 1) // cell + 1):
+                for cx in range(
+                    brick.x // cell, (brick.x + brick.width - 1) // cell + 1
+                ):
+                    self._brick_grid.setdefault((cx, cy), []).append(index)
+
     def get_layer(self, layer_name: str) -> Optional[LevelLayer]:
         """Get a specific layer by name."""
         return self.layers.get(layer_name)
 
     def get_all_objects(self) -> List[LevelObject]:
         """Get all objects from all layers."""
-        all_objects = []
-        for layer in self.layers.values():
-            all_objects.extend(layer.objects)
-        return all_objects
+        return list(self._all_objects)
 
     def get_objects_by_type(self, object_type: str) -> List[LevelObject]:
         """Get all objects of a specific type across all layers."""
-        objects = []
-        for layer in self.layers.values():
-            for obj in layer.objects:
-                if obj.type == object_type:
-                    objects.append(obj)
-        return objects
+        return list(self._by_type.get(object_type, ()))
+
+    def query_bricks(self, rect: pygame.Rect) -> List[LevelObject]:
+        """Get the bricks in the grid cells under a rect, in level order.
+
+        This is a broad phase: the bricks returned may not overlap the rect
+        itself, and inactive bricks are included.
+        """
+        if rect.width <= 0 or rect.height <= 0:
+            return []
+        cell = BRICK_GRID_CELL_SIZE
+        grid = self._brick_grid
+        indices = set()
+        for cy in range(rect.top // cell, (rect.bottom - 1) // cell + 1):
+            for cx in range(rect.left // cell, (rect.right - 1) // cell + 1):
+                bucket = grid.get((cx, cy))
+                if bucket is not None:
+                    indices.update(bucket)
+        bricks = self._bricks
+        return [bricks[i] for i in sorted(indices)]
 
     def get_objects_in_view(
         self, camera_x: float, camera_y: float, screen_width: int, screen_height: int
@@ -168,57 +348,133 @@ class LevelRenderer:
 
     def __init__(self, level_data: LevelData):
         self.level_data = level_data
+        # Per-type drawing, all called as handler(surface, rect, color)
+        self._handlers: Dict[
+            str,
+            Callable[
+                [pygame.Surface, pygame.Rect, Optional[Tuple[int, int, int]]], None
+            ],
+        ] = {
+            "brick": self._render_brick,
+            "platform": self._render_platform,
+            "ladder": self._render_ladder,
+            "mountain": self._render_mountain,
+            "hill": self._render_hill,
+            "foreground_accent": self._render_foreground_accent,
+        }
+        # Layers composited once at full size, keyed by layer name, with the
+        # layer-space position of their top-left corner; None if not bakeable
+        self._baked_layers: Dict[
+            str, Optional[Tuple[pygame.Surface, Tuple[int, int]]]
+        ] = {}
+        # Layer version each bake was made from, so hidden or shown objects
+        # trigger a fresh one
+        self._baked_versions: Dict[str, int] = {}
 
     def render_layer(
         self, surface: pygame.Surface, layer_name: str, camera_x: float, camera_y: float
     ) -> None:
         """Render a specific layer of the level."""
-        layer = self.level_data.get_layer(layer_name)
-        if not layer:
-            return
-
-        visible_objects = layer.get_objects_in_view(
-            camera_x, camera_y, surface.get_width(), surface.get_height()
-        )
+        self.render(surface, (layer_name,), camera_x, camera_y)
 
-        for obj in visible_objects:
-            self._render_object(surface, obj, camera_x, camera_y, layer.parallax_factor)
+    def render(
+        self,
+        surface: pygame.Surface,
+        layer_names: Sequence[str],
+        camera_x: float,
+        camera_y: float,
+    ) -> None:
+        """Render the named layers back to front, skipping any that are missing."""
+        width, height = surface.get_size()
+        # Most layers share a parallax factor, and with it the camera offset
+        offsets: Dict[float, Tuple[int, int]] = {}
+        for layer_name in layer_names:
+            layer = self.level_data.get_layer(layer_name)
+            if not layer:
+                continue
+            factor = layer.parallax_factor
+            offset = offsets.get(factor)
+            if offset is None:
+                offset = (int(camera_x * factor), int(camera_y * factor))
+                offsets[factor] = offset
+            offset_x, offset_y = offset
+            if self._baked_versions.get(layer_name) != layer._version:
+                self._baked_layers[layer_name] = self._bake_layer(layer)
+                self._baked_versions[layer_name] = layer._version
+            baked = self._baked_layers[layer_name]
+            if baked is not None:
+                image, (left, top) = baked
+                surface.blit(image, (left - offset_x, top - offset_y))
+                continue
+            for obj in layer._cull(
+                offset_x, offset_y, offset_x + width, offset_y + height
+            ):
+                self._render_object(surface, obj, offset_x, offset_y)
+
+    def _bake_layer(
+        self, layer: LevelLayer
+    ) -> Optional[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Composite a static layer into one colorkeyed surface.
+
+        Layers holding bricks change as bricks break and are drawn per object,
+        as are empty layers and ones too large to keep in memory. Other layers
+        are baked again whenever one of their objects is shown or hidden.
+        """
+        objects = [obj for obj in layer.objects if obj.active]
+        if not objects or any(obj.type == "brick" for obj in layer.objects):
+            return None
+        left = min(obj.x for obj in objects)
+        top = min(obj.y for obj in objects)
+        width = max(obj.x + obj.width for obj in objects) - left + _SPRITE_OVERHANG
+        height = max(obj.y + obj.height for obj in objects) - top
+        if width * height > _MAX_BAKED_LAYER_PIXELS:
+            return None
+        image = convert_for_display(pygame.Surface((width, height)), alpha=False)
+        image.fill(_SPRITE_COLORKEY)
+        for obj in objects:
+            self._render_object(image, obj, left, top)
+        image.set_colorkey(_SPRITE_COLORKEY)
+        return image, (left, top)
 
     def _render_object(
         self,
         surface: pygame.Surface,
         obj: LevelObject,
-        camera_x: float,
-        camera_y: float,
-        parallax_factor: float,
+        offset_x: int,
+        offset_y: int,
     ) -> None:
-        """Render a single level object."""
+        """Render a single level object shifted by the layer's camera offset."""
         # Only render active objects
-        if not obj.is_active():
+        if not obj.active:
             return
 
-        rect = obj.get_rect_with_camera(camera_x, camera_y, parallax_factor)
-
-        if obj.type == "brick":
-            self._render_brick(surface, rect)
-        elif obj.type == "platform":
-            self._render_platform(surface, rect)
-        elif obj.type == "ladder":
-            self._render_ladder(surface, rect)
-        elif obj.type == "mountain":
-            self._render_mountain(surface, rect, obj.color)
-        elif obj.type == "hill":
-            self._render_hill(surface, rect, obj.color)
-        elif obj.type == "foreground_accent":
-            self._render_foreground_accent(surface, rect, obj.color)
+        rect = obj.get_rect().move(-offset_x, -offset_y)
+
+        handler = self._handlers.get(obj.type)
+        if handler is not None:
+            handler(surface, rect, obj.color)
         else:
             # Default rendering for unknown object types
             color = obj.color or (128, 128, 128)
             pygame.draw.rect(surface, color, rect)
 
-    def _render_brick(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
+    def _blit_tile_sprite(
+        self,
+        surface: pygame.Surface,
+        rect: pygame.Rect,
+        painter: Callable[[pygame.Surface, pygame.Rect], None],
+    ) -> None:
+        """Blit tile artwork painted once per size instead of every frame."""
+        surface.blit(_tile_sprite(painter, rect.width, rect.height), rect.topleft)
+
+    def _render_brick(
+        self,
+        surface: pygame.Surface,
+        rect: pygame.Rect,
+        color: Optional[Tuple[int, int, int]],
+    ) -> None:
         """Render a brick tile using the same logic as the game."""
-        render_brick_tile(surface, rect)
+        self._blit_tile_sprite(surface, rect, render_brick_tile)
 
     def _render_mountain(
         self,
@@ -240,13 +496,23 @@ class LevelRenderer:
         hill_color = color or (40, 46, 60)
         pygame.draw.rect(surface, hill_color, rect)
 
-    def _render_platform(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
+    def _render_platform(
+        self,
+        surface: pygame.Surface,
+        rect: pygame.Rect,
+        color: Optional[Tuple[int, int, int]],
+    ) -> None:
         """Render a platform tile using the same logic as the game."""
-        render_platform_tile(surface, rect)
+        self._blit_tile_sprite(surface, rect, render_platform_tile)
 
-    def _render_ladder(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
+    def _render_ladder(
+        self,
+        surface: pygame.Surface,
+        rect: pygame.Rect,
+        color: Optional[Tuple[int, int, int]],
+    ) -> None:
         """Render a ladder tile using the same logic as the game."""
-        render_ladder_tile(surface, rect)
+        self._blit_tile_sprite(surface, rect, render_ladder_tile)
 
     def _render_foreground_accent(
         self,
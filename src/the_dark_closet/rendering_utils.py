@@ -5,83 +5,154 @@ This module contains common rendering functions used across different
 scene implementations to maintain consistency and reduce duplication.
 """
 
-from typing import Optional
+from typing import Dict, Optional, Sequence, Tuple
 import pygame
 
+HUD_MESSAGE = "Arrows/WASD to move, Space/Up to jump, Esc to quit"
+HUD_COLOR = (210, 210, 220)
+
+
+def convert_for_display(surface: pygame.Surface, alpha: bool = True) -> pygame.Surface:
+    """Convert a surface to the display pixel format for fast blits.
+
+    Returns the surface unchanged when no display mode has been set yet.
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+
+# Past this many dirty rects, or this share of the screen, one full flip is
+# cheaper than updating the rects one by one
+MAX_DIRTY_RECTS = 40
+MAX_DIRTY_AREA_FRACTION = 1 / 3
+
+
+def present(screen: pygame.Surface, dirty_rects: Sequence[pygame.Rect]) -> None:
+    """Push a drawn frame to the display, as dirty rects while that is cheaper."""
+    if len(dirty_rects) > MAX_DIRTY_RECTS:
+        pygame.display.flip()
+        return
+    area_limit = screen.get_width() * screen.get_height() * MAX_DIRTY_AREA_FRACTION
+    if sum(rect.width * rect.height for rect in dirty_rects) > area_limit:
+        pygame.display.flip()
+    else:
+        pygame.display.update(dirty_rects)
+
+
+BRICK_BASE_COLOR = (135, 90, 60)
+BRICK_COLOR = (155, 110, 80)
+BRICK_HIGHLIGHT_COLOR = (175, 130, 100)
+MORTAR_COLOR = (200, 200, 200)
+PLATFORM_COLOR = (190, 190, 200)
+PLATFORM_GRAIN_COLOR = (170, 170, 180)
+LADDER_COLOR = (200, 170, 70)
+LADDER_RAIL_COLOR = (180, 150, 50)
+
+# Solid color blocks keyed by (color, width, height), blitted in batches by
+# the tile renderers instead of one draw call per rect
+_swatches: Dict[Tuple[Tuple[int, int, int], int, int], pygame.Surface] = {}
+
+
+def _swatch(color: Tuple[int, int, int], width: int, height: int) -> pygame.Surface:
+    """Return a cached surface of the given size filled with ``color``."""
+    key = (color, width, height)
+    swatch = _swatches.get(key)
+    if swatch is None:
+        swatch = pygame.Surface((width, height))
+        swatch.fill(color)
+        _swatches[key] = swatch
+    return swatch
+
 
 def render_brick_tile(surface: pygame.Surface, rect: pygame.Rect) -> None:
     """Render a brick tile with mortar lines and texture."""
     # Base brick color
-    pygame.draw.rect(surface, (135, 90, 60), rect)
+    surface.fill(BRICK_BASE_COLOR, rect)
 
     # Create brick pattern with alternating rows
     brick_height = 16
     brick_width = 32
-
-    for row in range(0, rect.height, brick_height):
-        for col in range(0, rect.width, brick_width):
-            # Offset every other row to create brick pattern
-            offset = (brick_width // 2) if (row // brick_height) % 2 == 1 else 0
-            brick_x = rect.x + col + offset
-            brick_y = rect.y + row
-
-            # Only draw brick if it's within the tile bounds
-            if brick_x < rect.x + rect.width and brick_y < rect.y + rect.height:
-                brick_rect = pygame.Rect(
-                    brick_x, brick_y, brick_width - 2, brick_height - 2
-                )
-                pygame.draw.rect(surface, (155, 110, 80), brick_rect)
-
-                # Add subtle highlight to each brick
-                highlight_rect = pygame.Rect(
-                    brick_x + 2, brick_y + 2, brick_width - 6, 4
-                )
-                pygame.draw.rect(surface, (175, 130, 100), highlight_rect)
+    brick = _swatch(BRICK_COLOR, brick_width - 2, brick_height - 2)
+    highlight = _swatch(BRICK_HIGHLIGHT_COLOR, brick_width - 6, 4)
+    left, top, width, height = rect
+    right = left + width
+
+    blit_sequence = []
+    for row in range(0, height, brick_height):
+        # Offset every other row to create brick pattern
+        offset = (brick_width // 2) if (row // brick_height) % 2 == 1 else 0
+        brick_y = top + row
+        # Only draw bricks starting within the tile bounds
+        for brick_x in range(left + offset, right, brick_width):
+            blit_sequence.append((brick, (brick_x, brick_y)))
+            # Add subtle highlight to each brick
+            blit_sequence.append((highlight, (brick_x + 2, brick_y + 2)))
 
     # Add subtle mortar lines
     # Horizontal mortar lines
-    for j in range(brick_height, rect.height, brick_height):
-        mortar_rect = pygame.Rect(rect.x, rect.y + j, rect.width, 1)
-        pygame.draw.rect(surface, (200, 200, 200), mortar_rect)
+    if brick_height < height:
+        mortar = _swatch(MORTAR_COLOR, width, 1)
+        for j in range(brick_height, height, brick_height):
+            blit_sequence.append((mortar, (left, top + j)))
 
     # Vertical mortar lines (fewer of them)
-    for i in range(brick_width, rect.width, brick_width):
-        mortar_rect = pygame.Rect(rect.x + i, rect.y, 1, rect.height)
-        pygame.draw.rect(surface, (200, 200, 200), mortar_rect)
+    if brick_width < width:
+        mortar = _swatch(MORTAR_COLOR, 1, height)
+        for i in range(brick_width, width, brick_width):
+            blit_sequence.append((mortar, (left + i, top)))
+
+    surface.blits(blit_sequence, doreturn=False)
 
 
 def render_platform_tile(surface: pygame.Surface, rect: pygame.Rect) -> None:
     """Render a platform tile with wood grain."""
+    left, top, width, height = rect
     # Platform with wood grain
-    platform_rect = pygame.Rect(rect.x, rect.y + rect.height - 24, rect.width, 24)
-    pygame.draw.rect(surface, (190, 190, 200), platform_rect)
+    surface.fill(PLATFORM_COLOR, (left, top + height - 24, width, 24))
     # Wood grain lines
-    for i in range(0, rect.width, 16):
-        grain_rect = pygame.Rect(rect.x + i, rect.y + rect.height - 20, 1, 16)
-        pygame.draw.rect(surface, (170, 170, 180), grain_rect)
+    grain = _swatch(PLATFORM_GRAIN_COLOR, 1, 16)
+    grain_y = top + height - 20
+    surface.blits(
+        [(grain, (left + i, grain_y)) for i in range(0, width, 16)], doreturn=False
+    )
 
 
 def render_ladder_tile(surface: pygame.Surface, rect: pygame.Rect) -> None:
     """Render a ladder tile with rungs."""
+    left, top, width, height = rect
     # Ladder with rungs
-    pygame.draw.rect(surface, (200, 170, 70), rect)
+    surface.fill(LADDER_COLOR, rect)
     # Vertical rails
-    left_rail = pygame.Rect(rect.x + 8, rect.y, 8, rect.height)
-    right_rail = pygame.Rect(rect.x + rect.width - 16, rect.y, 8, rect.height)
-    pygame.draw.rect(surface, (180, 150, 50), left_rail)
-    pygame.draw.rect(surface, (180, 150, 50), right_rail)
+    rail = _swatch(LADDER_RAIL_COLOR, 8, height)
+    blit_sequence = [(rail, (left + 8, top)), (rail, (left + width - 16, top))]
     # Rungs
-    for j in range(16, rect.height, 32):
-        rung_rect = pygame.Rect(rect.x + 8, rect.y + j, rect.width - 16, 8)
-        pygame.draw.rect(surface, (180, 150, 50), rung_rect)
+    if width > 16:
+        rung = _swatch(LADDER_RAIL_COLOR, width - 16, 8)
+        for j in range(16, height, 32):
+            blit_sequence.append((rung, (left + 8, top + j)))
+    surface.blits(blit_sequence, doreturn=False)
 
 
-def render_hud(surface: pygame.Surface, hud_font: Optional[pygame.font.Font]) -> None:
-    """Render the HUD with controls information."""
-    if hud_font:
-        msg = "Arrows/WASD to move, Space/Up to jump, Esc to quit"
-        text = hud_font.render(msg, True, (210, 210, 220))
-        surface.blit(text, (48, 48))  # 4x 12, 12 for higher resolution
+def render_hud_text(hud_font: pygame.font.Font) -> pygame.Surface:
+    """Rasterize the HUD controls message once for reuse across frames."""
+    return convert_for_display(hud_font.render(HUD_MESSAGE, True, HUD_COLOR))
+
+
+def render_hud(
+    surface: pygame.Surface,
+    hud_font: Optional[pygame.font.Font],
+    hud_text: Optional[pygame.Surface] = None,
+) -> None:
+    """Render the HUD with controls information.
+
+    Pass a pre-rendered ``hud_text`` to skip font rasterization.
+    """
+    if hud_text is None:
+        if not hud_font:
+            return
+        hud_text = hud_font.render(HUD_MESSAGE, True, HUD_COLOR)
+    surface.blit(hud_text, (48, 48))  # 4x 12, 12 for higher resolution
 
 
 def render_center_mass_dot(
@@ -98,6 +169,20 @@ def render_center_mass_dot(
 class PlayerState:
     """Shared player state configuration to eliminate duplication."""
 
+    __slots__ = (
+        "player_rect",
+        "player_velocity_x",
+        "player_velocity_y",
+        "player_speed_px_per_sec",
+        "player_jump_speed_px_per_sec",
+        "gravity_px_per_sec2",
+        "on_ground",
+        "on_ladder",
+        "camera_x",
+        "camera_y",
+        "hud_font",
+    )
+
     def __init__(self, spawn_x: int, spawn_y: int):
         self.player_rect = pygame.Rect(spawn_x, spawn_y, 104, 120)  # 4x 26x30
         self.player_velocity_x: float = 0.0
@@ -139,16 +224,6 @@ class PlayerMixin:
     def _init_player_state(self, spawn_x: int, spawn_y: int) -> None:
         """Initialize player state using shared configuration."""
         self.player_state = PlayerState(spawn_x, spawn_y)
-        self.player_rect = self.player_state.player_rect
-        self.player_velocity_x = self.player_state.player_velocity_x
-        self.player_velocity_y = self.player_state.player_velocity_y
-        self.player_speed_px_per_sec = self.player_state.player_speed_px_per_sec
-        self.player_jump_speed_px_per_sec = (
-            self.player_state.player_jump_speed_px_per_sec
-        )
-        self.gravity_px_per_sec2 = self.player_state.gravity_px_per_sec2
-        self.on_ground = self.player_state.on_ground
-        self.on_ladder = self.player_state.on_ladder
-        self.camera_x = self.player_state.camera_x
-        self.camera_y = self.player_state.camera_y
-        self.hud_font = self.player_state.hud_font
+        # Copy the defaults onto the scene, where physics reads and writes them
+        # as plain attributes every frame
+        initialize_player_from_state(self, self.player_state)
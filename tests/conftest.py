@@ -7,9 +7,11 @@ from __future__ import annotations
 import os
 import sys
 from pathlib import Path
-from typing import Generator, Tuple, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Generator, List, Optional, Tuple
 import shutil
 
+import numpy as np
 import pytest
 import pygame
 
@@ -57,64 +59,74 @@ def test_game_app(game_config, controlled_time_provider) -> GameApp:
     return GameApp(game_config, controlled_time_provider)
 
 
+# Room layouts shared by the room fixtures; tuples, so no test can edit them
+_SIMPLE_ROOM = (
+    "BBBBBBBBBBBB",  # Top boundary
+    "B          B",  # Empty
+    "B          B",  # Empty
+    "B          B",  # Empty
+    "B          B",  # Empty
+    "B          B",  # Empty
+    "B          B",  # Empty
+    "BBBBBBBBBBBB",  # Bottom boundary
+)
+
+_PLATFORM_ROOM = (
+    "BBBBBBBBBBBB",  # Top boundary
+    "B          B",  # Empty
+    "B    PP    B",  # Platform
+    "B          B",  # Empty
+    "B          B",  # Empty
+    "B          B",  # Empty
+    "B          B",  # Empty
+    "BBBBBBBBBBBB",  # Bottom boundary
+)
+
+_BRICK_ROOM = (
+    "BBBBBBBBBBBB",  # Top boundary
+    "B          B",  # Empty
+    "B          B",  # Empty
+    "B   BBBB   B",  # Breakable bricks
+    "B          B",  # Empty
+    "B          B",  # Empty
+    "B          B",  # Empty
+    "BBBBBBBBBBBB",  # Bottom boundary
+)
+
+_LADDER_ROOM = (
+    "BBBBBBBBBBBB",  # Top boundary
+    "B          B",  # Empty
+    "B    HH    B",  # Ladder
+    "B    HH    B",  # Ladder
+    "B    HH    B",  # Ladder
+    "B          B",  # Empty
+    "B          B",  # Empty
+    "BBBBBBBBBBBB",  # Bottom boundary
+)
+
+
 @pytest.fixture
-def simple_room() -> List[str]:
+def simple_room() -> Tuple[str, ...]:
     """Simple test room layout."""
-    return [
-        "BBBBBBBBBBBB",  # Top boundary
-        "B          B",  # Empty
-        "B          B",  # Empty
-        "B          B",  # Empty
-        "B          B",  # Empty
-        "B          B",  # Empty
-        "B          B",  # Empty
-        "BBBBBBBBBBBB",  # Bottom boundary
-    ]
+    return _SIMPLE_ROOM
 
 
 @pytest.fixture
-def platform_room() -> List[str]:
+def platform_room() -> Tuple[str, ...]:
     """Room with platforms for testing."""
-    return [
-        "BBBBBBBBBBBB",  # Top boundary
-        "B          B",  # Empty
-        "B    PP    B",  # Platform
-        "B          B",  # Empty
-        "B          B",  # Empty
-        "B          B",  # Empty
-        "B          B",  # Empty
-        "BBBBBBBBBBBB",  # Bottom boundary
-    ]
+    return _PLATFORM_ROOM
 
 
 @pytest.fixture
-def brick_room() -> List[str]:
+def brick_room() -> Tuple[str, ...]:
     """Room with breakable bricks."""
-    return [
-        "BBBBBBBBBBBB",  # Top boundary
-        "B          B",  # Empty
-        "B          B",  # Empty
-        "B   BBBB   B",  # Breakable bricks
-        "B          B",  # Empty
-        "B          B",  # Empty
-        "B          B",  # Empty
-        "BBBBBBBBBBBB",  # Bottom boundary
-    ]
+    return _BRICK_ROOM
 
 
 @pytest.fixture
-def ladder_room() -> List[str]:
+def ladder_room() -> Tuple[str, ...]:
     """Room with ladders."""
-    return [
-        "BBBBBBBBBBBB",  # Top boundary
-        "B          B",  # Empty
-        "B    HH    B",  # Ladder
-        "B    HH    B",  # Ladder
-        "B    HH    B",  # Ladder
-        "B          B",  # Empty
-        "B          B",  # Empty
-        "BBBBBBBBBBBB",  # Bottom boundary
-    ]
+    return _LADDER_ROOM
 
 
 @pytest.fixture
@@ -128,7 +140,11 @@ def test_scene(test_game_app, simple_room) -> SideScrollerScene:
 
 @pytest.fixture
 def temp_assets_dir() -> Generator[Path, None, None]:
-    """Temporary directory for generated assets."""
+    """Temporary directory for generated assets.
+
+    Shared by all pytest-xdist workers: SideScrollerScene loads its character
+    art from here, and every worker writes identical files.
+    """
     build_dir = Path("build/generated_assets")
     build_dir.mkdir(parents=True, exist_ok=True)
     yield build_dir
@@ -142,8 +158,15 @@ def generated_assets(temp_assets_dir) -> dict:
 
 @pytest.fixture
 def output_dir() -> Generator[Path, None, None]:
-    """Temporary directory for test outputs."""
+    """Temporary directory for test outputs.
+
+    Each pytest-xdist worker (``pytest -n auto``) gets its own directory, so
+    parallel runs never write the same screenshot at once.
+    """
     build_dir = Path("build/test_outputs")
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker:
+        build_dir = build_dir / worker
     build_dir.mkdir(parents=True, exist_ok=True)
     yield build_dir
 
@@ -166,9 +189,32 @@ def cleanup_temp_files():
                 shutil.rmtree(path, ignore_errors=True)
 
 
+def pytest_addoption(parser):
+    """Add command line options."""
+    parser.addoption(
+        "--save-screenshots",
+        action="store_true",
+        default=False,
+        help="Write debug-only screenshots under the test output directories",
+    )
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Wait for background screenshot writes and surface their errors."""
+    if _screenshot_writer is None:
+        return
+    _screenshot_writer.shutdown(wait=True)
+    for future in _pending_screenshots:
+        future.result()
+
+
 # Pytest markers for different test types
 def pytest_configure(config):
-    """Configure pytest markers."""
+    """Configure pytest markers and screenshot saving."""
+    global SAVE_DEBUG_SCREENSHOTS
+    if config.getoption("--save-screenshots"):
+        SAVE_DEBUG_SCREENSHOTS = True
+
     config.addinivalue_line("markers", "unit: Unit tests")
     config.addinivalue_line("markers", "integration: Integration tests")
     config.addinivalue_line("markers", "visual: Visual regression tests")
@@ -179,15 +225,35 @@ def pytest_configure(config):
 
 
 # Helper functions for tests
+# Debug-only screenshots are written only when explicitly requested
+SAVE_DEBUG_SCREENSHOTS = os.environ.get("THE_DARK_CLOSET_SAVE_SCREENSHOTS") == "1"
+# Background PNG encoding for debug screenshots, drained at session end
+_screenshot_writer: Optional[ThreadPoolExecutor] = None
+_pending_screenshots: List[Future] = []
+
+
 def find_center_mass_position(surface: pygame.Surface) -> Tuple[int, int] | None:
-    """Find the center mass dot position in a surface."""
-    width, height = surface.get_size()
-    for y in range(height):
-        for x in range(width):
-            color = surface.get_at((x, y))
-            if color[:3] == (255, 0, 255):  # Magenta center mass dot
-                return (x, y)
-    return None
+    """Find the center mass dot position in a surface.
+
+    Returns the first magenta pixel in row-major order, scanned in one
+    vectorized pass over the surface pixels.
+    """
+    if surface.get_bytesize() == 4:
+        # Compare packed 32-bit pixels in one pass, ignoring any alpha bits
+        pixels = pygame.surfarray.pixels2d(surface)  # (width, height), no copy
+        rgb_bits = 0xFFFFFFFF & ~surface.get_masks()[3]
+        magenta = surface.map_rgb((255, 0, 255)) & rgb_bits
+        mask = (pixels & rgb_bits) == magenta
+    else:
+        pixels = pygame.surfarray.array3d(surface)  # (width, height, 3)
+        mask = (pixels[..., 0] == 255) & (pixels[..., 1] == 0) & (pixels[..., 2] == 255)
+    # Release the surface lock before returning
+    del pixels
+    # Transpose so hits come back ordered by row, then column
+    ys, xs = np.nonzero(mask.T)
+    if not xs.size:
+        return None
+    return (int(xs[0]), int(ys[0]))
 
 
 def assert_center_mass_at(
@@ -208,3 +274,22 @@ def save_surface(surface: pygame.Surface, out_path: Path) -> None:
     """Save a pygame surface to a file."""
     out_path.parent.mkdir(parents=True, exist_ok=True)
     pygame.image.save(surface, str(out_path))
+
+
+def save_debug_surface(surface: pygame.Surface, out_path: Path) -> None:
+    """Save a screenshot only kept for debugging, when asked to.
+
+    Pass --save-screenshots or set THE_DARK_CLOSET_SAVE_SCREENSHOTS=1 to write
+    them; by default the PNG encode is skipped. The pixels are copied right
+    away and encoded on a background thread, so the test keeps stepping frames.
+    Tests that read their screenshots back use save_surface.
+    """
+    global _screenshot_writer
+    if not SAVE_DEBUG_SCREENSHOTS:
+        return
+    if _screenshot_writer is None:
+        _screenshot_writer = ThreadPoolExecutor(max_workers=4)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    _pending_screenshots.append(
+        _screenshot_writer.submit(pygame.image.save, surface.copy(), str(out_path))
+    )
@@ -0,0 +1,288 @@
+"""
+Test the main game loop and its frame scheduling.
+"""
+
+from collections import defaultdict
+from pathlib import Path
+
+import pygame
+
+from the_dark_closet.game import (
+    GameApp,
+    GameConfig,
+    ControlledTimeProvider,
+    MenuScene,
+    SideScrollerScene,
+    TILE_EMPTY_BYTE,
+    INPUT_LEFT,
+    INPUT_UP,
+    INPUT_JUMP,
+    read_input_mask,
+)
+from the_dark_closet.json_scene import JSONScene
+
+
+def _make_app(width: int = 512, height: int = 384) -> GameApp:
+    config = GameConfig(width, height, "Game Loop Test", 60)
+    return GameApp(config, ControlledTimeProvider(1.0 / 60.0))
+
+
+class TestFrameCoherence:
+    """Test that idle scenes are not redrawn every frame."""
+
+    def test_idle_menu_draws_once(self, monkeypatch):
+        """An idle menu should only be drawn on its first frame."""
+        app = _make_app()
+        scene = app._current_scene
+        assert isinstance(scene, MenuScene)
+
+        draw_calls = []
+        original_draw = scene.draw
+
+        def counting_draw(surface):
+            draw_calls.append(surface)
+            original_draw(surface)
+
+        monkeypatch.setattr(scene, "draw", counting_draw)
+
+        app.run(max_frames=5)
+
+        assert len(draw_calls) == 1
+        assert scene.dirty is False
+
+    def test_moving_player_marks_scene_dirty(self, test_game_app, simple_room):
+        """Moving the player should flag the scene for redraw."""
+        scene = SideScrollerScene(test_game_app, simple_room, (6 * 128, 4 * 128))
+        test_game_app.switch_scene(scene)
+        assert scene.dirty is True
+
+        scene.dirty = False
+        test_game_app.advance_frame({pygame.K_RIGHT})
+        assert scene.dirty is True
+
+    def test_breaking_tile_marks_scene_dirty(self, test_game_app, simple_room):
+        """Changing a tile should flag the scene for redraw."""
+        scene = SideScrollerScene(test_game_app, simple_room, (6 * 128, 4 * 128))
+        scene.dirty = False
+
+        scene._set_tile(0, 0, TILE_EMPTY_BYTE)
+
+        assert scene.dirty is True
+
+
+class TestDirtyRects:
+    """Test partial presentation of side scroller frames."""
+
+    def test_still_camera_reports_player_areas(self, simple_room):
+        """Only the player's old and new areas change while the camera is still."""
+        # Wider than the room, so the camera never scrolls
+        app = _make_app(2048, 1200)
+        scene = SideScrollerScene(app, simple_room, (6 * 128, 4 * 128))
+        scene.on_enter()
+        surface = pygame.Surface((app.width, app.height))
+
+        assert scene.draw(surface) is None
+
+        scene.player_rect.x += 10
+        dirty_rects = scene.draw(surface)
+
+        assert dirty_rects is not None
+        assert len(dirty_rects) == 2
+        assert dirty_rects[1].contains(scene.player_rect.move(-int(scene.camera_x), 0))
+
+    def test_breaking_tile_reports_tile_area(self, simple_room):
+        """A tile change adds the tile and its overhang to the dirty rects."""
+        # Wider than the room, so the camera never scrolls
+        app = _make_app(2048, 1200)
+        scene = SideScrollerScene(app, simple_room, (6 * 128, 4 * 128))
+        scene.on_enter()
+        surface = pygame.Surface((app.width, app.height))
+        scene.draw(surface)
+
+        scene._set_tile(1, 0, TILE_EMPTY_BYTE)
+        dirty_rects = scene.draw(surface)
+
+        assert dirty_rects is not None
+        assert pygame.Rect(128, 0, 256, 256) in dirty_rects
+        assert len(scene.draw(surface)) == 2
+
+    def test_json_scene_reports_player_areas(self):
+        """A still JSON scene reports the player's areas until a brick breaks."""
+        # Wider than the level, so the camera never scrolls
+        app = _make_app(2048, 1200)
+        scene = JSONScene(app, Path("levels/test_brick_breaking.json"))
+        surface = pygame.Surface((app.width, app.height))
+
+        assert scene.draw(surface) is None
+        previous = surface.copy()
+        scene.player_rect.move_ip(40, -30)
+        dirty_rects = scene.draw(surface)
+
+        assert dirty_rects is not None
+        assert len(dirty_rects) == 2
+        # Updating only the dirty rects of the previous frame must give the
+        # new frame, which is what present() relies on
+        for rect in dirty_rects:
+            previous.blit(surface, rect, rect)
+        assert pygame.image.tobytes(previous, "RGB") == pygame.image.tobytes(
+            surface, "RGB"
+        )
+
+        brick = scene.level_data.get_objects_by_type("brick")[0]
+        scene.player_rect.midtop = brick.get_rect().midbottom
+        scene.player_rect.y -= 4
+        scene.player_velocity_y = -100
+        scene._check_collisions()
+
+        assert not brick.is_active()
+        assert scene.draw(surface) is None
+
+    def test_run_updates_dirty_rects_only(self, monkeypatch, simple_room):
+        """After the first frame the loop pushes dirty rects instead of flipping."""
+        app = _make_app()
+        scene = SideScrollerScene(app, simple_room, (6 * 128, 4 * 128))
+        app.switch_scene(scene)
+        rect = pygame.Rect(0, 0, 8, 8)
+        flips = []
+        updates = []
+
+        def still_draw(surface):
+            return [rect]
+
+        monkeypatch.setattr(scene, "draw", still_draw)
+        monkeypatch.setattr(
+            scene, "update", lambda delta: setattr(scene, "dirty", True)
+        )
+        monkeypatch.setattr(pygame.display, "flip", lambda: flips.append(True))
+        monkeypatch.setattr(pygame.display, "update", updates.append)
+
+        app.run(max_frames=3)
+
+        assert len(flips) == 1
+        assert updates == [[rect], [rect]]
+
+    def test_run_flips_when_dirty_area_is_large(self, monkeypatch, simple_room):
+        """Dirty rects covering much of the screen are presented with a flip."""
+        app = _make_app()
+        scene = SideScrollerScene(app, simple_room, (6 * 128, 4 * 128))
+        app.switch_scene(scene)
+        big_rects = [pygame.Rect(0, 0, app.width, app.height // 2)]
+        many_rects = [pygame.Rect(i, 0, 1, 1) for i in range(100)]
+        frames = iter([None, big_rects, many_rects])
+        flips = []
+        updates = []
+
+        monkeypatch.setattr(scene, "draw", lambda surface: next(frames))
+        monkeypatch.setattr(
+            scene, "update", lambda delta: setattr(scene, "dirty", True)
+        )
+        monkeypatch.setattr(pygame.display, "flip", lambda: flips.append(True))
+        monkeypatch.setattr(pygame.display, "update", updates.append)
+
+        app.run(max_frames=3)
+
+        assert len(flips) == 3
+        assert not updates
+
+
+class TestHeadlessFrames:
+    """Test stepping the game without drawing."""
+
+    def test_headless_frame_matches_advance_frame(self, monkeypatch, simple_room):
+        """Headless frames move the player the same way but never draw."""
+        positions = []
+        for headless in (False, True):
+            app = _make_app()
+            scene = SideScrollerScene(app, simple_room, (6 * 128, 4 * 128))
+            app.switch_scene(scene)
+            draws = []
+            flips = []
+            monkeypatch.setattr(scene, "draw", draws.append)
+            monkeypatch.setattr(pygame.display, "flip", lambda: flips.append(True))
+
+            step = app.advance_frame_headless if headless else app.advance_frame
+            for _ in range(8):
+                step({pygame.K_RIGHT})
+            positions.append(scene.player_rect.topleft)
+
+            assert bool(draws) is not headless
+            assert bool(flips) is not headless
+
+        assert positions[0] == positions[1]
+
+
+class TestInputMask:
+    """Test folding pressed keys into the input bitmask."""
+
+    def test_arrow_and_letter_keys_share_bits(self):
+        """Arrow keys and their WASD twins set the same bits."""
+        keys = defaultdict(bool, {pygame.K_a: True, pygame.K_UP: True})
+
+        assert read_input_mask(keys) == INPUT_LEFT | INPUT_UP
+
+    def test_space_sets_jump(self):
+        """Space is reported as jump only."""
+        keys = defaultdict(bool, {pygame.K_SPACE: True})
+
+        assert read_input_mask(keys) == INPUT_JUMP
+
+
+class TestScriptedRun:
+    """Test the deterministic scripted loop."""
+
+    def test_scripted_keys_drive_player(self, test_game_app, simple_room):
+        """Held keys reach the scene through one reusable proxy."""
+        scene = SideScrollerScene(test_game_app, simple_room, (6 * 128, 4 * 128))
+        test_game_app.switch_scene(scene)
+        original_get_pressed = pygame.key.get_pressed
+        start_x = scene.player_rect.x
+        proxies = []
+
+        def capture(frame, surface):
+            proxies.append(pygame.key.get_pressed())
+
+        test_game_app.run_scripted(
+            4, keys_for_frame=lambda frame: {pygame.K_RIGHT}, capture_callback=capture
+        )
+
+        assert scene.player_rect.x > start_x
+        assert all(proxy is proxies[0] for proxy in proxies)
+        assert pygame.key.get_pressed is original_get_pressed
+
+    def test_scene_switch_rebinds_handlers(self, test_game_app):
+        """Events after a scene switch reach the new scene."""
+        assert isinstance(test_game_app._current_scene, MenuScene)
+
+        test_game_app.run_scripted(
+            3,
+            keys_for_frame=lambda frame: {pygame.K_RETURN} if frame == 0 else set(),
+        )
+
+        assert isinstance(test_game_app._current_scene, SideScrollerScene)
+
+    def test_key_plan_matches_callable(self, simple_room):
+        """A precomputed key plan drives the player like keys_for_frame."""
+        positions = []
+        for use_plan in (False, True):
+            app = _make_app()
+            scene = SideScrollerScene(app, simple_room, (6 * 128, 4 * 128))
+            app.switch_scene(scene)
+            plan = [{pygame.K_RIGHT}] * 6 + [set()] * 3 + [{pygame.K_LEFT}] * 3
+            if use_plan:
+                app.run_scripted(len(plan), key_plan=plan)
+            else:
+                app.run_scripted(len(plan), keys_for_frame=plan.__getitem__)
+            positions.append(scene.player_rect.topleft)
+
+        assert positions[0] == positions[1]
+
+    def test_flips_only_when_capturing(self, monkeypatch, test_game_app):
+        """Frames are presented only for the capture callback."""
+        flips = []
+        monkeypatch.setattr(pygame.display, "flip", lambda: flips.append(True))
+
+        test_game_app.run_scripted(5)
+        assert not flips
+
+        test_game_app.run_scripted(5, capture_callback=lambda frame, surface: None)
+        assert len(flips) == 5
@@ -10,7 +10,11 @@ import pytest
 import pygame
 from pathlib import Path
 
-from ..conftest import find_center_mass_position, assert_center_mass_at, save_surface
+from ..conftest import (
+    find_center_mass_position,
+    assert_center_mass_at,
+    save_debug_surface,
+)
 from the_dark_closet.json_scene import JSONScene
 
 
@@ -34,7 +38,7 @@ class TestJSONMovement:
 
             # Save screenshot
             screenshot_path = output_dir / f"json_move_right_{i:02d}.png"
-            save_surface(test_game_app._screen, screenshot_path)
+            save_debug_surface(test_game_app._screen, screenshot_path)
 
         # Check that character moved in world coordinates
         final_world_x = scene.player_rect.x
@@ -64,7 +68,7 @@ class TestJSONMovement:
 
             # Save screenshot
             screenshot_path = output_dir / f"json_move_left_{i:02d}.png"
-            save_surface(test_game_app._screen, screenshot_path)
+            save_debug_surface(test_game_app._screen, screenshot_path)
 
         # Check that character moved in world coordinates
         final_world_x = scene.player_rect.x
@@ -97,7 +101,7 @@ class TestJSONMovement:
 
         # Save final screenshot
         screenshot_path = output_dir / "json_combined_movement.png"
-        save_surface(test_game_app._screen, screenshot_path)
+        save_debug_surface(test_game_app._screen, screenshot_path)
 
         # Check that character is back near starting position
         final_world_x = scene.player_rect.x
@@ -131,7 +135,7 @@ class TestJSONJumping:
 
             # Save screenshot
             screenshot_path = output_dir / f"json_jump_attempt_{i:02d}.png"
-            save_surface(test_game_app._screen, screenshot_path)
+            save_debug_surface(test_game_app._screen, screenshot_path)
 
         # Check that character jumped (moved up in world coordinates)
         final_world_y = scene.player_rect.y
@@ -174,7 +178,7 @@ class TestJSONJumping:
 
             # Save screenshot
             screenshot_path = output_dir / f"json_continue_falling_{i:02d}.png"
-            save_surface(test_game_app._screen, screenshot_path)
+            save_debug_surface(test_game_app._screen, screenshot_path)
 
         # Check that character fell (moved down in world coordinates)
         final_world_y = scene.player_rect.y
@@ -208,7 +212,7 @@ class TestJSONBrickBreaking:
 
             # Save screenshot
             screenshot_path = output_dir / f"json_approach_brick_{i:02d}.png"
-            save_surface(test_game_app._screen, screenshot_path)
+            save_debug_surface(test_game_app._screen, screenshot_path)
 
         # Check that character moved towards brick
         final_world_x = scene.player_rect.x
@@ -242,7 +246,7 @@ class TestJSONBrickBreaking:
 
             # Save screenshot
             screenshot_path = output_dir / f"json_break_brick_{i:02d}.png"
-            save_surface(test_game_app._screen, screenshot_path)
+            save_debug_surface(test_game_app._screen, screenshot_path)
 
         # Check that character moved and jumped
         final_world_x = scene.player_rect.x
@@ -275,7 +279,7 @@ class TestJSONCharacterRendering:
 
         # Save screenshot
         screenshot_path = output_dir / "json_character_visible.png"
-        save_surface(test_game_app._screen, screenshot_path)
+        save_debug_surface(test_game_app._screen, screenshot_path)
 
         # Check that character is visible (center mass dot should be present)
         pos = find_center_mass_position(test_game_app._screen)
@@ -332,7 +336,7 @@ def test_movement_parametrized(test_game_app, keys, expected_movement, output_di
 
     # Save final screenshot
     screenshot_path = output_dir / f"json_parametrized_{keys}_{0:02d}.png"
-    save_surface(test_game_app._screen, screenshot_path)
+    save_debug_surface(test_game_app._screen, screenshot_path)
 
     # Check movement based on expected type
     final_world_x = scene.player_rect.x
@@ -14,7 +14,9 @@ from typing import List
 
 from the_dark_closet.game import GameApp, GameConfig, ControlledTimeProvider
 from the_dark_closet.json_scene import JSONScene
-from the_dark_closet.level_loader import LevelData
+from the_dark_closet import level_loader
+from the_dark_closet.level_loader import LevelData, LevelRenderer
+from the_dark_closet.rendering_utils import render_brick_tile
 
 
 class JSONLevelValidator:
@@ -602,6 +604,163 @@ class TestJSONLevelPlacement:
         assert len(hill_objects) == 2
         assert all(obj.type == "hill" for obj in hill_objects)
 
+    def test_layer_culling_matches_camera_rects(self, test_level_path):
+        """Culling keeps exactly the objects whose camera rect is on screen."""
+        level_data = LevelData(test_level_path)
+        screen = pygame.Rect(0, 0, 512, 384)
+
+        for layer in level_data.layers.values():
+            for camera_x, camera_y in ((0, 0), (300.5, 128), (1100, 700)):
+                expected = [
+                    obj
+                    for obj in layer.objects
+                    if obj.get_rect_with_camera(
+                        camera_x, camera_y, layer.parallax_factor
+                    ).colliderect(screen)
+                ]
+                assert (
+                    layer.get_objects_in_view(camera_x, camera_y, 512, 384) == expected
+                )
+
+    def test_tile_sprites_match_direct_drawing(self, test_game_app, test_level_path):
+        """Cached tile sprites draw the same pixels as painting each frame."""
+        level_data = LevelData(test_level_path)
+        renderer = LevelRenderer(level_data)
+        cached = pygame.Surface((512, 384))
+        direct = pygame.Surface((512, 384))
+
+        renderer.render_layer(cached, "tiles", 0, 512)
+        renderer.render_layer(cached, "tiles", 0, 512)
+        layer = level_data.get_layer("tiles")
+        for obj in layer.get_objects_in_view(0, 512, 512, 384):
+            if obj.type == "brick":
+                render_brick_tile(direct, obj.get_rect_with_camera(0, 512))
+
+        assert pygame.image.tobytes(cached, "RGB") == pygame.image.tobytes(
+            direct, "RGB"
+        )
+
+    def test_tile_sprites_are_shared_between_renderers(self, test_level_path):
+        """A second renderer reuses the tile sprites painted by the first."""
+        surface = pygame.Surface((512, 384))
+        LevelRenderer(LevelData(test_level_path)).render_layer(surface, "tiles", 0, 512)
+        sprite = level_loader._tile_sprites[(render_brick_tile, 128, 128)]
+
+        LevelRenderer(LevelData(test_level_path)).render_layer(surface, "tiles", 0, 512)
+
+        assert level_loader._tile_sprites[(render_brick_tile, 128, 128)] is sprite
+
+    def test_tile_sprites_painted_headless_are_converted_later(
+        self, monkeypatch, test_game_app
+    ):
+        """Sprites painted before a display mode exists are redone in its format."""
+        with monkeypatch.context() as patch:
+            patch.setattr(pygame.display, "get_surface", lambda: None)
+            early = level_loader._tile_sprite(render_brick_tile, 96, 48)
+
+        sprite = level_loader._tile_sprite(render_brick_tile, 96, 48)
+
+        assert sprite is not early
+        assert level_loader._tile_sprite(render_brick_tile, 96, 48) is sprite
+        assert sprite.get_bitsize() == pygame.display.get_surface().get_bitsize()
+
+    def test_level_reloads_after_file_changes(self, tmp_path):
+        """Parsed levels are reused only while the file is unchanged."""
+        level_path = tmp_path / "level.json"
+        level_path.write_text('{"metadata": {"name": "First"}}', encoding="utf-8")
+        first = LevelData(level_path)
+        first.metadata["name"] = "Edited"
+
+        assert LevelData(level_path).metadata["name"] == "First"
+
+        level_path.write_text('{"metadata": {"name": "Second!"}}', encoding="utf-8")
+
+        assert LevelData(level_path).metadata["name"] == "Second!"
+
+    def test_baked_layers_match_per_object_drawing(
+        self, monkeypatch, test_game_app, test_level_path
+    ):
+        """Static layers drawn from their baked surface look the same."""
+        layers = ("background", "midground", "tiles", "foreground")
+        baked = LevelRenderer(LevelData(test_level_path))
+        baked_surface = pygame.Surface((512, 384))
+        baked.render(baked_surface, layers, 300, 200)
+        monkeypatch.setattr(level_loader, "_MAX_BAKED_LAYER_PIXELS", 0)
+        direct = LevelRenderer(LevelData(test_level_path))
+        direct_surface = pygame.Surface((512, 384))
+        direct.render(direct_surface, layers, 300, 200)
+
+        assert baked._baked_layers["background"] is not None
+        assert baked._baked_layers["tiles"] is None
+        assert direct._baked_layers["background"] is None
+        assert pygame.image.tobytes(baked_surface, "RGB") == pygame.image.tobytes(
+            direct_surface, "RGB"
+        )
+
+    def test_deactivated_objects_leave_baked_layers(
+        self, test_game_app, test_level_path
+    ):
+        """Hiding or showing an object in a baked layer redraws that layer."""
+        layers = ("background", "midground")
+        level = LevelData(test_level_path)
+        renderer = LevelRenderer(level)
+        surface = pygame.Surface((512, 384))
+
+        def draw(renderer: LevelRenderer) -> bytes:
+            surface.fill((0, 0, 0))
+            renderer.render(surface, layers, 0, 0)
+            return pygame.image.tobytes(surface, "RGB")
+
+        shown = draw(renderer)
+        assert renderer._baked_layers["background"] is not None
+
+        for layer_name in layers:
+            for obj in level.get_layer(layer_name).objects:
+                obj.deactivate()
+        hidden = draw(renderer)
+
+        assert hidden != shown
+        assert hidden == draw(LevelRenderer(level))
+
+        for layer_name in layers:
+            for obj in level.get_layer(layer_name).objects:
+                obj.activate()
+
+        assert draw(renderer) == shown
+
+    def test_object_lookups_return_fresh_lists(self, test_level_path):
+        """Callers can edit the returned lists without touching the level."""
+        level_data = LevelData(test_level_path)
+
+        level_data.get_objects_by_type("brick").clear()
+        level_data.get_all_objects().clear()
+
+        assert len(level_data.get_objects_by_type("brick")) == 24
+        assert level_data.get_objects_by_type("missing") == []
+        assert len(level_data.get_all_objects()) == sum(
+            len(layer.objects) for layer in level_data.layers.values()
+        )
+
+    def test_query_bricks_matches_full_scan(self, test_level_path):
+        """The brick grid finds every overlapping brick, in level order."""
+        level_data = LevelData(test_level_path)
+        all_bricks = level_data.get_objects_by_type("brick")
+
+        for probe in (
+            pygame.Rect(100, 700, 104, 120),
+            pygame.Rect(0, 768, 1536, 256),
+            pygame.Rect(-50, -50, 40, 40),
+        ):
+            expected = [
+                brick for brick in all_bricks if brick.get_rect().colliderect(probe)
+            ]
+            found = [
+                brick
+                for brick in level_data.query_bricks(probe)
+                if brick.get_rect().colliderect(probe)
+            ]
+            assert found == expected
+
     def _save_debug_image(
         self,
         screenshot: Image.Image,
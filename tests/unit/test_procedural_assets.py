@@ -8,8 +8,12 @@ import pytest
 import pygame
 from pathlib import Path
 
-from the_dark_closet.assets import generate_character_assets
-from ..conftest import find_center_mass_position, save_surface
+from the_dark_closet.assets import (
+    generate_character_assets,
+    generate_character_surfaces,
+)
+from the_dark_closet.game import SideScrollerScene
+from ..conftest import find_center_mass_position, save_debug_surface
 
 
 class TestAssetGeneration:
@@ -168,6 +172,21 @@ class TestAssetGeneration:
                     size1 == size2
                 ), f"Asset '{asset_name}' sizes differ: {size1} vs {size2}"
 
+    @pytest.mark.unit
+    @pytest.mark.asset
+    def test_surfaces_match_saved_assets(self, temp_assets_dir):
+        """In-memory surfaces hold the same pixels as the saved PNG files."""
+        surfaces = generate_character_surfaces()
+        asset_paths = generate_character_assets(temp_assets_dir)
+
+        assert set(surfaces) == set(asset_paths)
+        for name in ("head", "eyes_open", "hat", "torso_left", "walk_right_2"):
+            loaded = pygame.image.load(asset_paths[name])
+            assert loaded.get_size() == surfaces[name].get_size()
+            assert pygame.image.tobytes(loaded, "RGBA") == pygame.image.tobytes(
+                surfaces[name], "RGBA"
+            ), f"Asset '{name}' differs from its saved file"
+
 
 class TestAssetLoading:
     """Test asset loading in game."""
@@ -215,6 +234,33 @@ class TestAssetLoading:
         # Should either load assets successfully or return empty dict
         assert isinstance(loaded_assets, dict), "Asset loading should return a dict"
 
+    @pytest.mark.unit
+    @pytest.mark.asset
+    def test_scaled_assets_are_reused(self, test_scene):
+        """Player parts are scaled on the first draw and reused afterwards."""
+        surface = pygame.Surface((test_scene.app.width, test_scene.app.height))
+        test_scene._draw_procedural_player(surface, test_scene.player_rect)
+        scaled = dict(test_scene._scaled_assets)
+
+        test_scene._draw_procedural_player(surface, test_scene.player_rect)
+
+        assert scaled
+        assert all(
+            test_scene._scaled_assets[key] is scaled[key] for key in scaled
+        ), "Scaled assets were rebuilt on the second draw"
+
+    @pytest.mark.unit
+    @pytest.mark.asset
+    def test_scenes_share_converted_assets(self, test_scene, simple_room):
+        """Scenes reuse the surfaces converted by the first one to load them."""
+        other = SideScrollerScene(test_scene.app, simple_room, (6 * 128, 4 * 128))
+
+        first = test_scene._load_character_assets()
+        second = other._load_character_assets()
+
+        assert first
+        assert all(second[name] is surface for name, surface in first.items())
+
 
 class TestCharacterRendering:
     """Test character rendering with procedural assets using JSON scenes."""
@@ -236,7 +282,7 @@ class TestCharacterRendering:
 
         # Save screenshot
         screenshot_path = output_dir / "character_with_assets.png"
-        save_surface(test_game_app._screen, screenshot_path)
+        save_debug_surface(test_game_app._screen, screenshot_path)
 
         # Check that character is visible
         pos = find_center_mass_position(test_game_app._screen)
@@ -263,7 +309,7 @@ class TestCharacterRendering:
 
             # Save screenshot
             screenshot_path = output_dir / f"consistency_frame_{i:02d}.png"
-            save_surface(test_game_app._screen, screenshot_path)
+            save_debug_surface(test_game_app._screen, screenshot_path)
 
         # Character should be visible in all frames (may fall due to gravity)
         assert all(
@@ -313,7 +359,7 @@ class TestCharacterRendering:
 
             # Save screenshot
             screenshot_path = output_dir / f"movement_frame_{i:02d}.png"
-            save_surface(test_game_app._screen, screenshot_path)
+            save_debug_surface(test_game_app._screen, screenshot_path)
 
         # Check that character moved in world coordinates
         final_world_x = scene.player_rect.x
@@ -0,0 +1,239 @@
+"""
+Test the SideScrollerScene tile grid.
+"""
+
+import pygame
+import pytest
+
+from the_dark_closet.game import (
+    SideScrollerScene,
+    TILE_EMPTY_BYTE,
+    TILE_METAL_BYTE,
+    TILE_BRICK_BYTE,
+    TILE_PLATFORM_BYTE,
+    TILE_LADDER_BYTE,
+    TILE_BOUNDARY_BYTE,
+    SOLID_TILES,
+    ONE_WAY_TILES,
+    LADDER_TILES,
+    COLLIDABLE_TILES,
+    _TILE_PAGE_COLORKEY,
+)
+
+
+class TestWorldGrid:
+    """Test tile lookups and edits on the world grid."""
+
+    def test_tile_lookup_uses_byte_codes(self, test_game_app, brick_room):
+        """Tiles are read back as byte codes of their map characters."""
+        scene = SideScrollerScene(test_game_app, brick_room, (6 * 128, 4 * 128))
+
+        assert scene._tile_at(0, 0) == TILE_BRICK_BYTE
+        assert scene._tile_at(1, 1) == TILE_EMPTY_BYTE
+        assert scene._tile_at(4, 3) == TILE_BRICK_BYTE
+
+    def test_outside_world_is_solid(self, test_game_app, simple_room):
+        """Lookups outside the grid behave like solid metal."""
+        scene = SideScrollerScene(test_game_app, simple_room, (6 * 128, 4 * 128))
+
+        assert scene._tile_at(-1, 0) == TILE_METAL_BYTE
+        assert scene._tile_at(0, -1) == TILE_METAL_BYTE
+        assert scene._tile_at(scene.world_cols, 0) == TILE_METAL_BYTE
+        assert scene._tile_at(0, scene.world_rows) == TILE_METAL_BYTE
+
+    def test_set_tile_edits_in_place(self, test_game_app, brick_room):
+        """Breaking a brick only changes the targeted cell."""
+        scene = SideScrollerScene(test_game_app, brick_room, (6 * 128, 4 * 128))
+
+        scene._set_tile(4, 3, TILE_EMPTY_BYTE)
+
+        assert scene._tile_at(4, 3) == TILE_EMPTY_BYTE
+        assert scene._tile_at(5, 3) == TILE_BRICK_BYTE
+        assert scene._tile_at(3, 3) == TILE_EMPTY_BYTE
+
+    def test_set_tile_writes_shared_buffer(self, test_game_app, brick_room):
+        """Edits are single byte writes visible through the row views."""
+        scene = SideScrollerScene(test_game_app, brick_room, (6 * 128, 4 * 128))
+        tiles = scene._tiles
+
+        scene._set_tile(4, 3, TILE_EMPTY_BYTE)
+
+        assert scene._tiles is tiles
+        assert tiles[3 * scene.world_cols + 4] == TILE_EMPTY_BYTE
+        assert scene.world_tiles[3][4] == TILE_EMPTY_BYTE
+
+    def test_row_flags_track_edits(self, test_game_app):
+        """Rows are flagged as filled only while they hold a non-empty tile."""
+        scene = SideScrollerScene(test_game_app, ["   ", " B ", "###"], (0, 0))
+
+        assert list(scene._row_filled) == [0, 1, 1]
+
+        scene._set_tile(1, 1, TILE_EMPTY_BYTE)
+        scene._set_tile(0, 0, TILE_BRICK_BYTE)
+
+        assert list(scene._row_filled) == [1, 0, 1]
+
+    def test_set_tile_ignores_out_of_range(self, test_game_app, simple_room):
+        """Edits outside the grid are ignored."""
+        scene = SideScrollerScene(test_game_app, simple_room, (6 * 128, 4 * 128))
+        scene.dirty = False
+
+        scene._set_tile(-1, 0, TILE_EMPTY_BYTE)
+        scene._set_tile(0, scene.world_rows, TILE_EMPTY_BYTE)
+
+        assert scene.dirty is False
+
+    def test_tiles_overlapping_rect_skips_empty(self, test_game_app, brick_room):
+        """Only non-empty tiles under the rect are reported."""
+        scene = SideScrollerScene(test_game_app, brick_room, (6 * 128, 4 * 128))
+        probe = pygame.Rect(3 * 128, 2 * 128, 2 * 128, 2 * 128)
+
+        tiles = list(scene._tiles_overlapping_rect(probe))
+
+        assert tiles == [(4, 3, TILE_BRICK_BYTE)]
+
+    def test_tiles_overlapping_rect_outside_world(self, test_game_app, simple_room):
+        """Cells beyond the world edge are reported as solid metal."""
+        scene = SideScrollerScene(test_game_app, simple_room, (6 * 128, 4 * 128))
+        probe = pygame.Rect(-128, 128, 128, 128)
+
+        tiles = list(scene._tiles_overlapping_rect(probe))
+
+        assert tiles == [(-1, 1, TILE_METAL_BYTE)]
+
+    def test_solid_col_span(self, test_game_app):
+        """The span covers the outermost solid columns under the rect."""
+        scene = SideScrollerScene(test_game_app, ["  H  ", "#  B ", "     "], (0, 0))
+
+        assert scene._solid_col_span(pygame.Rect(0, 0, 5 * 128, 2 * 128)) == (0, 3)
+        assert scene._solid_col_span(pygame.Rect(128, 0, 2 * 128, 128)) is None
+        # Columns past the right edge of the world count as solid
+        beyond_edge = pygame.Rect(4 * 128, 2 * 128, 256, 128)
+        assert scene._solid_col_span(beyond_edge) == (5, 5)
+
+    def test_short_rows_are_padded_with_empty(self, test_game_app):
+        """Ragged maps are stored as a full grid padded with empty tiles."""
+        scene = SideScrollerScene(test_game_app, ["###", "#", "###"], (0, 0))
+
+        assert scene.world_cols == 3
+        assert len(scene._tiles) == 9
+        assert scene._tile_at(1, 1) == TILE_EMPTY_BYTE
+        assert bytes(scene.world_tiles[1]) == b"#  "
+
+    def test_default_world_has_ladders(self, test_game_app):
+        """The handcrafted world stamps its connecting ladders."""
+        scene = SideScrollerScene(test_game_app)
+
+        assert scene._tile_at(22, 6) == TILE_LADDER_BYTE
+        assert scene._tile_at(84, 8) == TILE_LADDER_BYTE
+        assert scene._tile_at(0, scene.world_rows - 1) == TILE_METAL_BYTE
+
+    def test_default_world_is_copied_per_scene(self, test_game_app):
+        """Edits in one scene never leak into another built from the default."""
+        first = SideScrollerScene(test_game_app)
+        second = SideScrollerScene(test_game_app)
+
+        first._set_tile(22, 6, TILE_EMPTY_BYTE)
+
+        assert second._tile_at(22, 6) == TILE_LADDER_BYTE
+
+    def test_restore_rolls_back_edits(self, test_game_app, brick_room):
+        """Restoring a snapshot undoes tile edits made after it."""
+        scene = SideScrollerScene(test_game_app, brick_room, (6 * 128, 4 * 128))
+        snap = scene.snapshot()
+        scene._tile_page(0, 0)
+
+        scene._set_tile(4, 3, TILE_EMPTY_BYTE)
+        scene.restore(snap)
+
+        assert scene._tile_at(4, 3) == TILE_BRICK_BYTE
+        assert scene.snapshot() == snap
+        page = scene._tile_page(0, 0)
+        assert page.get_at((4 * 128 + 4, 3 * 128 + 4))[:3] != _TILE_PAGE_COLORKEY
+
+    def test_restore_rejects_other_worlds(self, test_game_app, brick_room):
+        """A snapshot of a differently sized world cannot be restored."""
+        scene = SideScrollerScene(test_game_app, brick_room, (6 * 128, 4 * 128))
+
+        with pytest.raises(ValueError):
+            scene.restore(b"#")
+
+
+class TestTileClassification:
+    """Test the tile classification lookup tables."""
+
+    def test_solid_tiles(self):
+        """Metal, brick and boundary tiles block movement."""
+        assert SOLID_TILES[TILE_METAL_BYTE]
+        assert SOLID_TILES[TILE_BRICK_BYTE]
+        assert SOLID_TILES[TILE_BOUNDARY_BYTE]
+        assert not SOLID_TILES[TILE_EMPTY_BYTE]
+        assert not SOLID_TILES[TILE_PLATFORM_BYTE]
+        assert not SOLID_TILES[TILE_LADDER_BYTE]
+
+    def test_one_way_and_ladder_tiles(self):
+        """Platforms and ladders are classified separately."""
+        assert ONE_WAY_TILES[TILE_PLATFORM_BYTE]
+        assert not ONE_WAY_TILES[TILE_BRICK_BYTE]
+        assert LADDER_TILES[TILE_LADDER_BYTE]
+        assert not LADDER_TILES[TILE_EMPTY_BYTE]
+
+    def test_collidable_tiles(self):
+        """Solid and one-way tiles can stop the player; ladders cannot."""
+        assert COLLIDABLE_TILES[TILE_BRICK_BYTE]
+        assert COLLIDABLE_TILES[TILE_PLATFORM_BYTE]
+        assert not COLLIDABLE_TILES[TILE_LADDER_BYTE]
+        assert not COLLIDABLE_TILES[TILE_EMPTY_BYTE]
+
+
+class TestTilePages:
+    """Test the pre-rendered world pages."""
+
+    def test_set_tile_repaints_rendered_page(self, test_game_app, brick_room):
+        """Breaking a brick clears it from an already rendered page."""
+        scene = SideScrollerScene(test_game_app, brick_room, (6 * 128, 4 * 128))
+        page = scene._tile_page(0, 0)
+        assert page.get_at((4 * 128 + 4, 3 * 128 + 4))[:3] != _TILE_PAGE_COLORKEY
+
+        scene._set_tile(4, 3, TILE_EMPTY_BYTE)
+
+        assert scene._tile_page(0, 0) is page
+        assert page.get_at((4 * 128 + 4, 3 * 128 + 4))[:3] == _TILE_PAGE_COLORKEY
+        assert page.get_at((5 * 128 + 4, 3 * 128 + 4))[:3] != _TILE_PAGE_COLORKEY
+
+    def test_only_visible_pages_are_rendered(self, test_game_app):
+        """Pages outside the viewport are never rendered."""
+        scene = SideScrollerScene(test_game_app)
+        surface = pygame.Surface((test_game_app.width, test_game_app.height))
+
+        scene._draw_tiles(surface, 0, 0)
+
+        assert set(scene._tile_pages) == {(0, 0)}
+
+    def test_page_keeps_tile_overhang(self, test_game_app):
+        """Artwork spilling past a tile edge survives the sprite cache."""
+        scene = SideScrollerScene(test_game_app, ["X ", "  "], (0, 0))
+
+        page = scene._tile_page(0, 0)
+
+        assert page.get_at((10, 129))[:3] == (100, 140, 180)
+        assert page.get_at((10, 140))[:3] == _TILE_PAGE_COLORKEY
+
+
+class TestScenery:
+    """Test the pre-rendered scenery layers."""
+
+    def test_backdrop_covers_whole_view(self, test_game_app):
+        """The far layer paints the sky, so no separate clear is needed."""
+        scene = SideScrollerScene(test_game_app)
+        scene.on_enter()
+        surface = pygame.Surface((test_game_app.width, test_game_app.height))
+        surface.fill((255, 0, 0))
+
+        scene._draw_parallax(surface, 0)
+
+        assert (255, 0, 0) not in {
+            surface.get_at((x, y))[:3]
+            for x in range(0, surface.get_width(), 16)
+            for y in range(0, surface.get_height(), 16)
+        }
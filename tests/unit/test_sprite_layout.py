@@ -19,6 +19,7 @@ from the_dark_closet.game import (
     ControlledTimeProvider,
     TILE_SIZE,
     TILE_BRICK,
+    TILE_BRICK_BYTE,
 )
 
 
@@ -248,7 +249,7 @@ class TestSpriteLayout:
 
         for tx, ty in test_positions:
             rect = pygame.Rect(tx * TILE_SIZE, ty * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-            scene._draw_detailed_tile(test_surface, rect, TILE_BRICK)
+            scene._draw_detailed_tile(test_surface, rect, TILE_BRICK_BYTE)
 
         # Save test surface
         screenshot_path = output_dir / "sprite_layout_test.png"
@@ -320,7 +321,7 @@ class TestSpriteLayout:
                 TILE_SIZE,
                 TILE_SIZE,
             )
-            scene._draw_detailed_tile(test_surface, rect, TILE_BRICK)
+            scene._draw_detailed_tile(test_surface, rect, TILE_BRICK_BYTE)
 
         # Save test surface
         screenshot_path = output_dir / "sprite_layout_offset_test.png"
@@ -384,7 +385,7 @@ class TestSpriteLayout:
 
         for tx, ty in test_positions:
             rect = pygame.Rect(tx * TILE_SIZE, ty * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-            scene._draw_detailed_tile(test_surface, rect, TILE_BRICK)
+            scene._draw_detailed_tile(test_surface, rect, TILE_BRICK_BYTE)
 
         # Save test surface
         screenshot_path = output_dir / "sprite_layout_edge_test.png"
@@ -89,3 +89,23 @@ def test_hud_with_none_font():
     assert (
         non_sky_pixels < 10000
     ), f"Too many non-sky pixels: {non_sky_pixels} - HUD might be rendering with None font"
+
+
+def test_prerendered_hud_matches_font_rendering():
+    """Test that blitting cached HUD text matches rendering it from the font."""
+    from the_dark_closet.rendering_utils import render_hud, render_hud_text
+
+    pygame.init()
+    font = pygame.font.Font(None, 96)
+
+    from_font = pygame.Surface((512, 384))
+    from_font.fill((18, 22, 30))
+    render_hud(from_font, font)
+
+    from_cache = pygame.Surface((512, 384))
+    from_cache.fill((18, 22, 30))
+    render_hud(from_cache, None, render_hud_text(font))
+
+    assert pygame.image.tobytes(from_font, "RGB") == pygame.image.tobytes(
+        from_cache, "RGB"
+    )